@@ -6,86 +6,195 @@ Creates a JSON file with 100,000 randomly generated map markers
 for testing application performance under load.
 """
 
+import itertools
 import json
+import math
+import os
 import random
 import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the (slower) stdlib encoder
+    orjson = None
 
 # Configuration
 NUM_MARKERS = 100_000
+CHUNK_SIZE = 10_000
 OUTPUT_FILE = "e2e_stress_test_data.json"
 
 # Poland approximate bounds for realistic coordinates
 LAT_MIN, LAT_MAX = 49.0, 54.8
 LON_MIN, LON_MAX = 14.1, 24.2
 
+# Coordinates have 6 decimal places, so they are drawn as integer micro-degrees
+COORD_SCALE = 1_000_000
+LAT_MIN_I, LAT_MAX_I = round(LAT_MIN * COORD_SCALE), round(LAT_MAX * COORD_SCALE)
+LON_MIN_I, LON_MAX_I = round(LON_MIN * COORD_SCALE), round(LON_MAX * COORD_SCALE)
+
 # Sample data for random generation
 PLACE_NAMES = ["Most", "Kładka", "Zwierzyniecka", "Warszawski", "Jagiełły", "Grunwaldzki"]
 PLACE_TYPES = ["small bridge", "big bridge"]
 ACCESS_OPTIONS = ["pedestrians", "bikes", "cars"]
 
-
-def generate_marker():
-    """Generate a single random marker."""
-    name = f"{random.choice(PLACE_NAMES)} {random.randint(1, 10000)}"
-    lat = round(random.uniform(LAT_MIN, LAT_MAX), 6)
-    lon = round(random.uniform(LON_MIN, LON_MAX), 6)
+# Every ordered, non-empty subset of ACCESS_OPTIONS, weighted so that each subset
+# size is equally likely - the same distribution as sampling a random number of
+# options (1..n) in random order.
+ACCESS_SUBSETS = [
+    subset
+    for size in range(1, len(ACCESS_OPTIONS) + 1)
+    for subset in itertools.permutations(ACCESS_OPTIONS, size)
+]
+ACCESS_SUBSET_CUM_WEIGHTS = list(
+    itertools.accumulate(
+        1 / math.perm(len(ACCESS_OPTIONS), len(subset)) for subset in ACCESS_SUBSETS
+    )
+)
+
+
+def generate_markers(count, rng=random):
+    """
+    Generate ``count`` random markers using ``rng`` (a ``random.Random``-like object).
+
+    Values are drawn column by column (one list per field) and only zipped
+    into per-marker dicts at the end, which keeps the per-row Python work to
+    a single dict construction.
+    """
+    randrange = rng.randrange
+    lats = [randrange(LAT_MIN_I, LAT_MAX_I + 1) / COORD_SCALE for _ in range(count)]
+    lons = [randrange(LON_MIN_I, LON_MAX_I + 1) / COORD_SCALE for _ in range(count)]
+    names = [
+        f"{name} {number}"
+        for name, number in zip(
+            rng.choices(PLACE_NAMES, k=count), rng.choices(range(1, 10001), k=count), strict=True
+        )
+    ]
+    place_types = rng.choices(PLACE_TYPES, k=count)
+
+    # One entropy read for all UUIDs instead of one per uuid4() call
+    raw = os.urandom(16 * count)
+    uuids = [str(uuid.UUID(bytes=raw[i : i + 16], version=4)) for i in range(0, 16 * count, 16)]
 
     # Random subset of access options (at least 1)
-    num_access = random.randint(1, len(ACCESS_OPTIONS))
-    accessible_by = random.sample(ACCESS_OPTIONS, num_access)
-
-    return {
-        "name": name,
-        "position": [lat, lon],
-        "accessible_by": accessible_by,
-        "type_of_place": random.choice(PLACE_TYPES),
-        "uuid": str(uuid.uuid4()),
-    }
+    accessible_by = rng.choices(ACCESS_SUBSETS, cum_weights=ACCESS_SUBSET_CUM_WEIGHTS, k=count)
+
+    return [
+        {
+            "name": name,
+            "position": [lat, lon],
+            "accessible_by": access,
+            "type_of_place": place_type,
+            "uuid": marker_uuid,
+        }
+        for name, lat, lon, access, place_type, marker_uuid in zip(
+            names, lats, lons, accessible_by, place_types, uuids, strict=True
+        )
+    ]
+
+
+def chunk_sizes(total, chunk_size=CHUNK_SIZE):
+    """Split ``total`` markers into chunks of at most ``chunk_size`` markers."""
+    return [min(chunk_size, total - start) for start in range(0, total, chunk_size)]
+
+
+def dumps(obj):
+    """Serialize ``obj`` to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def generate_chunk(count):
+    """
+    Generate ``count`` markers and return them serialized as the body of a JSON array.
+
+    Runs in a worker process, so it uses its own ``random.Random`` (seeded from
+    the OS) instead of the module-level generator state inherited from the parent.
+    """
+    return dumps(generate_markers(count, random.Random()))[1:-1]
+
+
+def map_bounded(executor, fn, items, window):
+    """
+    Like ``executor.map(fn, items)``, but with at most ``window`` calls in flight.
+
+    ``Executor.map`` submits every item up front and keeps finished results until
+    they are consumed. Here a new item is submitted only after the oldest result
+    has been yielded, so at most ``window`` results are held in memory.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def write_data(f, marker_chunks, map_metadata, site_content):
+    """
+    Stream the Goodmap data file to ``f``.
+
+    ``marker_chunks`` yields serialized marker chunks (see ``generate_chunk``),
+    which are written straight into the ``map.data`` array as they arrive, so
+    memory use is bounded by however many chunks the iterable buffers (see
+    ``map_bounded``). The remaining ``map`` keys and ``site_content`` are written
+    afterwards to close the document.
+    """
+    f.write(b'{"map":{"data":[')
+    for i, chunk in enumerate(marker_chunks):
+        if i:
+            f.write(b",")
+        f.write(chunk)
+    f.write(b"],")
+    f.write(dumps(map_metadata)[1:])
+    f.write(b',"site_content":')
+    f.write(dumps(site_content))
+    f.write(b"}")
 
 
 def main():
     """Generate stress test data file."""
-    print(f"Generating {NUM_MARKERS:,} markers...")
-
-    markers = [generate_marker() for _ in range(NUM_MARKERS)]
-
-    data = {
-        "map": {
-            "data": markers,
-            "location_obligatory_fields": [
-                ["name", "str"],
-                ["accessible_by", "list"],
-                ["type_of_place", "str"],
-            ],
-            "categories": {
-                "accessible_by": ACCESS_OPTIONS,
-                "type_of_place": PLACE_TYPES,
-            },
-            "visible_data": ["accessible_by", "type_of_place"],
-            "meta_data": ["uuid"],
+    map_metadata = {
+        "location_obligatory_fields": [
+            ["name", "str"],
+            ["accessible_by", "list"],
+            ["type_of_place", "str"],
+        ],
+        "categories": {
+            "accessible_by": ACCESS_OPTIONS,
+            "type_of_place": PLACE_TYPES,
         },
-        "site_content": {
-            "pages": [],
-            "menu_items": {
-                "en": [{"name": "Map", "url": "/"}],
-                "pl": [{"name": "Mapa", "url": "/"}],
-            },
-            "logo_url": "",
-            "font": {
-                "name": "Poppins",
-                "url": "https://fonts.googleapis.com/css2?family=Poppins",
-            },
-            "primary_color": "#FFFFFF",
-            "secondary_color": "#245466",
-            "left_bar_width": "300px",
+        "visible_data": ["accessible_by", "type_of_place"],
+        "meta_data": ["uuid"],
+    }
+    site_content = {
+        "pages": [],
+        "menu_items": {
+            "en": [{"name": "Map", "url": "/"}],
+            "pl": [{"name": "Mapa", "url": "/"}],
+        },
+        "logo_url": "",
+        "font": {
+            "name": "Poppins",
+            "url": "https://fonts.googleapis.com/css2?family=Poppins",
         },
+        "primary_color": "#FFFFFF",
+        "secondary_color": "#245466",
+        "left_bar_width": "300px",
     }
 
-    print(f"Writing to {OUTPUT_FILE}...")
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    sizes = chunk_sizes(NUM_MARKERS)
+
+    print(f"Generating {NUM_MARKERS:,} markers into {OUTPUT_FILE}...")
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor, open(OUTPUT_FILE, "wb") as f:
+        chunks = map_bounded(executor, generate_chunk, sizes, 2 * workers)
+        write_data(f, chunks, map_metadata, site_content)
 
-    print(f"Done! Generated {len(markers):,} markers.")
+    print(f"Done! Generated {sum(sizes):,} markers.")
 
 
 if __name__ == "__main__":
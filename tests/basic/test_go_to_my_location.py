@@ -11,6 +11,12 @@ from playwright.sync_api import Page, expect
 
 from tests.conftest import BASE_URL, MARKER_LOAD_TIMEOUT, TEST_LOCATIONS
 
+TILE_PATTERNS = {
+    name: re.compile(location["tile_pattern"])
+    for name, location in TEST_LOCATIONS.items()
+    if "tile_pattern" in location
+}
+
 
 class TestGoToMyLocationButton:
     """Test suite for geolocation functionality"""
@@ -31,8 +37,6 @@ class TestGoToMyLocationButton:
         Verify clicking the "go to my location" button moves the map
         to the user's location and loads the correct map tiles.
         """
-        location = TEST_LOCATIONS["RYSY_MOUNTAIN"]
-
         # Click the "My Location" button
         my_location_button = page.locator(
             '.MuiButtonBase-root > [data-testid="MyLocationIcon"] > path'
@@ -43,5 +47,5 @@ class TestGoToMyLocationButton:
         # Different frontend versions may zoom to slightly different levels (14-16)
         map_tile = page.locator(".leaflet-tile-container > img").first
         expect(map_tile).to_have_attribute(
-            "src", re.compile(location["tile_pattern"]), timeout=MARKER_LOAD_TIMEOUT
+            "src", TILE_PATTERNS["RYSY_MOUNTAIN"], timeout=MARKER_LOAD_TIMEOUT
         )
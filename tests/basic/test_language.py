@@ -11,21 +11,15 @@ import pytest
 from playwright.sync_api import Page, expect
 
 from tests.conftest import BASE_URL, MARKER_LOAD_TIMEOUT
+from tests.helpers import (
+    expand_cluster_and_click_rightmost_marker,
+    get_language_button,
+    get_popup,
+    switch_to_language,
+)
 
 
-def get_language_button(page: Page):
-    """
-    Get language switch button using flexible selectors.
-
-    The button's accessible name changes with language:
-    - English: "Language switch icon, used to change the language..."
-    - Polish: "Ikona zmiany języka, używana do zmiany języka strony"
-
-    Uses ID selector which works across all languages.
-    """
-    return page.locator("#languages-menu")
-
-
+@pytest.mark.usefixtures("no_external_resources")
 class TestLanguageSwitching:
     """Test suite for language switching functionality"""
 
@@ -47,14 +41,8 @@ class TestLanguageSwitching:
 
     def test_switch_to_polish_changes_menu_items(self, page: Page):
         """Verify switching to Polish changes menu items"""
-        # Click language switcher
-        get_language_button(page).click()
-
-        # Select Polish
-        page.get_by_role("link", name="polski").click()
-
-        # Wait for page to reload
-        page.wait_for_load_state("domcontentloaded")
+        # Switch to Polish and wait for page to reload
+        switch_to_language(page, "polski")
 
         # Verify language button shows 'pl' (re-locate after navigation)
         lang_button = get_language_button(page)
@@ -64,50 +52,6 @@ class TestLanguageSwitching:
         expect(page.get_by_role("link", name="Mapa")).to_be_visible()
         expect(page.get_by_role("link", name="O nas")).to_be_visible()
 
-    def test_switch_to_polish_changes_popup_text(self, page: Page):
-        """Verify switching to Polish changes popup UI text"""
-        # Switch to Polish first
-        get_language_button(page).click()
-        page.get_by_role("link", name="polski").click()
-        page.wait_for_load_state("domcontentloaded")
-
-        # Click marker cluster to expand
-        page.locator(".leaflet-marker-icon").first.click()
-
-        # Wait for markers to appear
-        markers = page.locator(".leaflet-marker-icon")
-        expect(markers).to_have_count(2, timeout=MARKER_LOAD_TIMEOUT)
-
-        # Click rightmost marker to open popup
-        page.evaluate(
-            """
-            () => {
-                const markers = document.querySelectorAll('.leaflet-marker-icon');
-                let rightmostMarker = null;
-                let maxX = -Infinity;
-
-                markers.forEach(marker => {
-                    const rect = marker.getBoundingClientRect();
-                    if (rect.x > maxX) {
-                        maxX = rect.x;
-                        rightmostMarker = marker;
-                    }
-                });
-
-                if (rightmostMarker) {
-                    rightmostMarker.click();
-                }
-            }
-        """
-        )
-
-        # Verify popup is visible
-        popup = page.locator(".leaflet-popup-content")
-        expect(popup).to_be_visible()
-
-        # Verify "report a problem" is in Polish
-        expect(popup.get_by_text("zgłoś problem")).to_be_visible()
-
     def test_about_page_url_changes_with_language(self, page: Page):
         """Verify About page URL changes based on language"""
         # English About link should point to /blog/page/about
@@ -115,9 +59,7 @@ class TestLanguageSwitching:
         expect(about_link_en).to_have_attribute("href", "/blog/page/about")
 
         # Switch to Polish
-        get_language_button(page).click()
-        page.get_by_role("link", name="polski").click()
-        page.wait_for_load_state("domcontentloaded")
+        switch_to_language(page, "polski")
 
         # Polish About link should point to /blog/page/o-nas
         about_link_pl = page.get_by_role("link", name="O nas")
@@ -126,20 +68,40 @@ class TestLanguageSwitching:
     def test_switch_back_to_english_restores_menu(self, page: Page):
         """Verify switching back to English restores original menu items"""
         # Switch to Polish
-        get_language_button(page).click()
-        page.get_by_role("link", name="polski").click()
-        page.wait_for_load_state("domcontentloaded")
+        switch_to_language(page, "polski")
 
         # Verify Polish
         expect(page.get_by_role("link", name="Mapa")).to_be_visible()
 
         # Switch back to English (re-locate button after navigation)
-        get_language_button(page).click()
-        page.get_by_role("link", name="English").click()
-        page.wait_for_load_state("domcontentloaded")
+        switch_to_language(page, "English")
 
         # Verify English restored (re-locate button after navigation)
         lang_button = get_language_button(page)
         expect(lang_button).to_contain_text("en")
         expect(page.get_by_role("link", name="Map", exact=True)).to_be_visible()
         expect(page.get_by_role("link", name="About")).to_be_visible()
+
+
+@pytest.mark.usefixtures("no_external_resources")
+class TestPolishLanguage:
+    """Test suite for UI text when Polish is already the selected language"""
+
+    @pytest.fixture
+    def page(self, polish_page: Page) -> Page:
+        """Run this class's tests on a page that starts in Polish"""
+        return polish_page
+
+    def test_popup_text_in_polish(self, page: Page):
+        """Verify popup UI text is in Polish"""
+        page.goto(BASE_URL, wait_until="domcontentloaded")
+
+        # Expand the cluster and click the rightmost marker to open its popup
+        expand_cluster_and_click_rightmost_marker(page, timeout=MARKER_LOAD_TIMEOUT)
+
+        # Verify popup is visible
+        popup = get_popup(page)
+        expect(popup).to_be_visible()
+
+        # Verify "report a problem" is in Polish
+        expect(popup.get_by_text("zgłoś problem")).to_be_visible()
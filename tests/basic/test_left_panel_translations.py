@@ -9,6 +9,14 @@ import pytest
 from playwright.sync_api import Page, expect
 
 from tests.conftest import BASE_URL
+from tests.helpers import get_left_panel, switch_to_language
+
+# Desktop layout, so the left panel is shown inline. These tests only check panel text,
+# so map tiles and web fonts are not loaded.
+pytestmark = [
+    pytest.mark.browser_context_args(viewport={"width": 1200, "height": 800}),
+    pytest.mark.usefixtures("no_external_resources"),
+]
 
 # Expected translations for left panel fields
 TRANSLATIONS = {
@@ -49,16 +57,32 @@ TRANSLATIONS = {
 }
 
 
-def get_language_button(page: Page):
-    """Get language switch button using ID selector."""
-    return page.locator("#languages-menu")
+def _missing_panel_texts(page: Page, expected_fields: dict[str, str]) -> dict[str, str]:
+    """
+    Return the entries of ``expected_fields`` whose text is not in the left panel.
+
+    All texts are searched for (case-insensitively) in a single evaluate() call, so
+    only one boolean per text crosses back from the browser.
+    """
+    found = get_left_panel(page).evaluate(
+        """(el, needles) => {
+            const text = el.textContent.toLowerCase();
+            return needles.map(needle => text.includes(needle.toLowerCase()));
+        }""",
+        list(expected_fields.values()),
+    )
+    return {
+        key: expected
+        for (key, expected), is_found in zip(expected_fields.items(), found, strict=True)
+        if not is_found
+    }
 
 
-def switch_to_language(page: Page, lang_name: str):
-    """Switch to a specific language by clicking the language menu."""
-    get_language_button(page).click()
-    page.get_by_role("link", name=lang_name).click()
-    page.wait_for_load_state("domcontentloaded")
+def _assert_help_tooltip(page: Page, expected: str) -> None:
+    """Hover the help icon labelled "Help: {expected}" and check its tooltip text."""
+    # hover() waits for the icon and fails if it never appears
+    page.get_by_label(f"Help: {expected}").first.hover()
+    expect(page.locator('[role="tooltip"]')).to_contain_text(expected)
 
 
 class TestLeftPanelTranslationsEnglish:
@@ -67,67 +91,62 @@ class TestLeftPanelTranslationsEnglish:
     @pytest.fixture(autouse=True)
     def setup(self, page: Page):
         """Navigate to home page and wait for filter form to load"""
-        page.set_viewport_size({"width": 1200, "height": 800})
-        page.goto(BASE_URL, wait_until="domcontentloaded")
+        page.goto(BASE_URL, wait_until="commit")
         # Auto-wait for content to be fully loaded
-        panel = page.locator("#left-panel")
+        panel = get_left_panel(page)
         expect(panel).to_contain_text("accessible by", ignore_case=True, timeout=10000)
 
-    def test_category_names_in_english(self, page: Page):
-        """Verify category names are displayed in English"""
-        panel = page.locator("#left-panel")
-        for key, expected in TRANSLATIONS["en"]["category_names"].items():
-            expect(panel).to_contain_text(
-                expected, ignore_case=True
-            ), f"Expected '{expected}' (translation of '{key}') in left panel"
-
-    def test_filter_options_in_english(self, page: Page):
-        """Verify filter options are displayed in English"""
-        panel = page.locator("#left-panel")
-        for key, expected in TRANSLATIONS["en"]["filter_options"].items():
-            expect(panel).to_contain_text(
-                expected, ignore_case=True
-            ), f"Expected '{expected}' (translation of '{key}') in left panel"
+    def test_panel_fields_in_english(self, page: Page):
+        """Verify category names and filter options are displayed in English"""
+        expected_fields = {
+            **TRANSLATIONS["en"]["category_names"],
+            **TRANSLATIONS["en"]["filter_options"],
+        }
+        missing = _missing_panel_texts(page, expected_fields)
+        assert not missing, f"Missing translations in left panel (key: expected text): {missing}"
 
 
 class TestLeftPanelTranslationsPolish:
     """Test suite for left panel translations in Polish"""
 
+    @pytest.fixture
+    def page(self, polish_page: Page) -> Page:
+        """Run this class's tests on a page that starts in Polish"""
+        return polish_page
+
     @pytest.fixture(autouse=True)
     def setup(self, page: Page):
-        """Navigate to home page, switch to Polish, and wait for filter form"""
-        page.set_viewport_size({"width": 1200, "height": 800})
-        page.goto(BASE_URL, wait_until="domcontentloaded")
-        switch_to_language(page, "polski")
+        """Navigate to home page and wait for the translated filter form"""
+        page.goto(BASE_URL, wait_until="commit")
         # Use expect().to_contain_text() to auto-wait for translated content
-        panel = page.locator("#left-panel")
+        panel = get_left_panel(page)
         expect(panel).to_contain_text("dostępny dla", ignore_case=True, timeout=10000)
 
-    def test_category_names_in_polish(self, page: Page):
-        """Verify category names are displayed in Polish"""
-        panel = page.locator("#left-panel")
-        for key, expected in TRANSLATIONS["pl"]["category_names"].items():
-            expect(panel).to_contain_text(
-                expected, ignore_case=True
-            ), f"Expected '{expected}' (Polish translation of '{key}') in left panel"
+    def test_panel_fields_in_polish(self, page: Page):
+        """Verify category names and filter options are displayed in Polish"""
+        expected_fields = {
+            **TRANSLATIONS["pl"]["category_names"],
+            **TRANSLATIONS["pl"]["filter_options"],
+        }
+        missing = _missing_panel_texts(page, expected_fields)
+        assert (
+            not missing
+        ), f"Missing Polish translations in left panel (key: expected text): {missing}"
 
-    def test_filter_options_in_polish(self, page: Page):
-        """Verify filter options are displayed in Polish"""
-        panel = page.locator("#left-panel")
-        for key, expected in TRANSLATIONS["pl"]["filter_options"].items():
-            expect(panel).to_contain_text(
-                expected, ignore_case=True
-            ), f"Expected '{expected}' (Polish translation of '{key}') in left panel"
+    def test_help_tooltip_in_polish(self, page: Page):
+        """Verify help tooltip shows Polish text when the UI language is Polish"""
+        _assert_help_tooltip(
+            page, TRANSLATIONS["pl"]["help_texts"]["categories_options_help_small bridge"]
+        )
 
 
 class TestLeftPanelTranslationSwitching:
     """Test suite for switching languages and verifying translations update"""
 
-    def test_switch_from_english_to_polish_updates_category_names(self, page: Page):
-        """Verify switching from English to Polish updates category names"""
-        page.set_viewport_size({"width": 1200, "height": 800})
-        page.goto(BASE_URL, wait_until="domcontentloaded")
-        panel = page.locator("#left-panel")
+    def test_language_round_trip_updates_category_names(self, page: Page):
+        """Verify switching English -> Polish -> English updates category names each time"""
+        page.goto(BASE_URL, wait_until="commit")
+        panel = get_left_panel(page)
 
         # Verify English first (auto-wait for content)
         expect(panel).to_contain_text("accessible by", ignore_case=True, timeout=10000)
@@ -136,16 +155,6 @@ class TestLeftPanelTranslationSwitching:
         switch_to_language(page, "polski")
         expect(panel).to_contain_text("dostępny dla", ignore_case=True, timeout=10000)
 
-    def test_switch_from_polish_to_english_updates_category_names(self, page: Page):
-        """Verify switching from Polish back to English restores English text"""
-        page.set_viewport_size({"width": 1200, "height": 800})
-        page.goto(BASE_URL, wait_until="domcontentloaded")
-        panel = page.locator("#left-panel")
-
-        # Switch to Polish first and verify (auto-wait for translated content)
-        switch_to_language(page, "polski")
-        expect(panel).to_contain_text("dostępny dla", ignore_case=True, timeout=10000)
-
         # Switch back to English and verify (auto-wait for translated content)
         switch_to_language(page, "English")
         expect(panel).to_contain_text("accessible by", ignore_case=True, timeout=10000)
@@ -156,37 +165,11 @@ class TestLeftPanelHelpTextTranslations:
 
     def test_help_tooltip_in_english(self, page: Page):
         """Verify help tooltip shows English text"""
-        page.set_viewport_size({"width": 1200, "height": 800})
-        page.goto(BASE_URL, wait_until="domcontentloaded")
+        page.goto(BASE_URL, wait_until="commit")
         # Auto-wait for content to be fully loaded
-        panel = page.locator("#left-panel")
+        panel = get_left_panel(page)
         expect(panel).to_contain_text("accessible by", ignore_case=True, timeout=10000)
 
-        # Find and hover over a help icon (label is "Help: {translated_text}")
-        expected = TRANSLATIONS["en"]["help_texts"]["categories_options_help_small bridge"]
-        help_icon = page.get_by_label(f"Help: {expected}")
-        assert help_icon.count() > 0, "Help icon not found - UI may have changed"
-        help_icon.first.hover()
-        tooltip = page.locator('[role="tooltip"]')
-        expect(tooltip).to_be_visible()
-        tooltip_text = tooltip.inner_text()
-        assert expected in tooltip_text, f"Expected '{expected}' in tooltip"
-
-    def test_help_tooltip_in_polish(self, page: Page):
-        """Verify help tooltip shows Polish text after language switch"""
-        page.set_viewport_size({"width": 1200, "height": 800})
-        page.goto(BASE_URL, wait_until="domcontentloaded")
-        switch_to_language(page, "polski")
-        # Auto-wait for translated content before interacting with help icon
-        panel = page.locator("#left-panel")
-        expect(panel).to_contain_text("dostępny dla", ignore_case=True, timeout=10000)
-
-        # Find and hover over a help icon (label is "Help: {translated_text}")
-        expected = TRANSLATIONS["pl"]["help_texts"]["categories_options_help_small bridge"]
-        help_icon = page.get_by_label(f"Help: {expected}")
-        assert help_icon.count() > 0, "Help icon not found - UI may have changed"
-        help_icon.first.hover()
-        tooltip = page.locator('[role="tooltip"]')
-        expect(tooltip).to_be_visible()
-        tooltip_text = tooltip.inner_text()
-        assert expected in tooltip_text, f"Expected '{expected}' in tooltip"
+        _assert_help_tooltip(
+            page, TRANSLATIONS["en"]["help_texts"]["categories_options_help_small bridge"]
+        )
@@ -8,8 +8,34 @@ Also tests that geolocation permission is requested on page load.
 
 import pytest
 from playwright.sync_api import Page, expect
-
-from tests.conftest import ALL_MOBILE_DEVICES, BASE_URL
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from tests.conftest import (
+    BASE_URL,
+    GEOLOCATION_DENIED_SCRIPT,
+    REPRESENTATIVE_MOBILE_DEVICE,
+    SLOW_MOBILE_DEVICES,
+    TEST_LOCATIONS,
+)
+from tests.helpers import expect_button_styles, goto_ready
+
+# Selectors of the location-dependent buttons, shared by all test classes below
+LOCATION_BUTTON = '[aria-label*="Location target"]'
+SUGGEST_BUTTON = '[data-testid="suggest-new-point"]'
+LIST_VIEW_BUTTON = "#listViewButton"
+LOCATION_DEPENDENT_BUTTONS = [LOCATION_BUTTON, SUGGEST_BUTTON, LIST_VIEW_BUTTON]
+TOOLTIP = '[role="tooltip"]'
+
+# Geolocation granted and set to Wroclaw when the test's browser context is created
+WROCLAW = TEST_LOCATIONS["WROCLAW_CENTER"]
+geolocation_granted_in_wroclaw = pytest.mark.browser_context_args(
+    geolocation={"latitude": WROCLAW["lat"], "longitude": WROCLAW["lon"]},
+    permissions=["geolocation"],
+)
+
+# Computed styles of the location-dependent buttons
+ENABLED_STYLE = {"opacity": "1", "filter": "none"}
+DISABLED_STYLE = {"opacity": "0.6", "filter": "grayscale(1)"}
 
 
 class TestGeolocationRequestOnPageLoad:
@@ -20,123 +46,79 @@ class TestGeolocationRequestOnPageLoad:
         Verify that the page loads correctly and the location button is visible.
         The new frontend only requests geolocation if permission is already granted.
         """
-        page.goto(BASE_URL, wait_until="domcontentloaded")
+        goto_ready(page, BASE_URL)
 
         # The location button should be visible
-        location_button = page.locator('[aria-label*="Location target"]')
+        location_button = page.locator(LOCATION_BUTTON)
         expect(location_button).to_be_visible(timeout=5000)
 
-    def test_buttons_respond_to_granted_permission_on_load(self, page: Page, geolocation):
+    @geolocation_granted_in_wroclaw
+    def test_buttons_respond_to_granted_permission_on_load(self, page: Page):
         """
         Verify that when geolocation is pre-granted, buttons become active on page load.
         This confirms the automatic geolocation request works correctly.
         """
-        # Grant geolocation permission and set location BEFORE navigating
-        geolocation(51.10655, 17.0555)  # Wroclaw
-
-        page.goto(BASE_URL, wait_until="domcontentloaded")
+        goto_ready(page, BASE_URL)
 
         # Verify buttons are active (not grayed out) - use explicit wait with timeout
-        location_button = page.locator('[aria-label*="Location target"]')
-        expect(location_button).to_have_css("opacity", "1", timeout=5000)
-        expect(location_button).to_have_css("filter", "none")
+        expect_button_styles(page, [LOCATION_BUTTON], ENABLED_STYLE, timeout=5000)
 
-    def test_buttons_show_disabled_when_permission_denied_on_load(self, browser):
+    def test_buttons_show_disabled_when_permission_denied_on_load(self, page: Page):
         """
         Verify that when geolocation permission is denied/not granted,
         buttons show disabled state on page load.
         """
         # Mock geolocation API to simulate permission denied - add at context level
-        # so it runs before any page script
-        geolocation_denied_script = """
-            // Override geolocation to simulate denied permission
-            Object.defineProperty(navigator, 'geolocation', {
-                value: {
-                    getCurrentPosition: function(success, error) {
-                        // Simulate permission denied error
-                        if (error) {
-                            error({
-                                code: 1,  // PERMISSION_DENIED
-                                message: 'User denied geolocation'
-                            });
-                        }
-                    },
-                    watchPosition: function() { return 0; },
-                    clearWatch: function() {}
-                },
-                writable: false
-            });
-        """
-
-        # Create context with the geolocation denial script
-        context = browser.new_context()
-        context.add_init_script(geolocation_denied_script)
-
-        page = context.new_page()
-
-        def block_hmr_route(route):
-            route.abort()
-
-        page.route("**/ws", block_hmr_route)
-        page.route("**/*.hot-update.*", block_hmr_route)
-
-        try:
-            page.goto(BASE_URL, wait_until="domcontentloaded")
-
-            # Verify buttons are disabled (grayed out) - use explicit wait with timeout
-            location_button = page.locator('[aria-label*="Location target"]')
-            expect(location_button).to_have_css("opacity", "0.6", timeout=5000)
-            expect(location_button).to_have_css("filter", "grayscale(1)")
-        finally:
-            page.close()
-            context.close()
+        # so it runs before any page script (also on already open pages' next navigation)
+        page.context.add_init_script(GEOLOCATION_DENIED_SCRIPT)
+
+        goto_ready(page, BASE_URL)
+
+        # Verify buttons are disabled (grayed out) - use explicit wait with timeout
+        expect_button_styles(page, [LOCATION_BUTTON], DISABLED_STYLE, timeout=5000)
 
 
 class TestLocationButtonsDesktop:
     """Test suite for location buttons on desktop"""
 
-    def test_all_buttons_colored_when_location_granted(self, page: Page, geolocation):
+    @geolocation_granted_in_wroclaw
+    def test_all_buttons_colored_when_location_granted(self, page: Page):
         """
         Verify all location-dependent buttons become colored
         when geolocation permission is granted.
         """
-        # Grant geolocation permission and set location
-        geolocation(51.10655, 17.0555)  # Wroclaw
-
-        page.goto(BASE_URL, wait_until="domcontentloaded")
+        goto_ready(page, BASE_URL)
 
-        # Check location button is not grayed out - use explicit wait with timeout
-        location_button = page.locator('[aria-label*="Location target"]')
-        expect(location_button).to_have_css("opacity", "1", timeout=5000)
-        expect(location_button).to_have_css("filter", "none")
-
-        # Check suggest button is not grayed out
-        suggest_button = page.locator('[data-testid="suggest-new-point"]')
-        expect(suggest_button).to_have_css("opacity", "1")
-        expect(suggest_button).to_have_css("filter", "none")
-
-        # Check list view button is not grayed out
-        list_view_button = page.locator("#listViewButton")
-        expect(list_view_button).to_have_css("opacity", "1")
-        expect(list_view_button).to_have_css("filter", "none")
+        # Check location, suggest and list view buttons are not grayed out
+        expect_button_styles(page, LOCATION_DEPENDENT_BUTTONS, ENABLED_STYLE, timeout=5000)
 
 
 class TestLocationButtonsDesktopDisabledState:
     """Test suite for location buttons disabled state on desktop"""
 
+    @pytest.fixture
+    def page(self, geolocation_denied_page: Page) -> Page:
+        """Run this class's tests on one page, loaded once with geolocation denied"""
+        return geolocation_denied_page
+
+    @pytest.fixture(autouse=True)
+    def dismiss_tooltip(self, page: Page):
+        """Move the mouse away after each test so its tooltip does not leak into the next"""
+        yield
+        page.mouse.move(0, 0)
+        page.wait_for_function("() => !document.querySelector('[role=\"tooltip\"]')")
+
     def test_location_button_shows_disabled_tooltip_on_hover(self, page: Page):
         """
         Verify location button shows disabled tooltip when hovering
         and geolocation is not granted.
         """
-        page.goto(BASE_URL, wait_until="domcontentloaded")
-
         # Hover over the location button
-        location_button = page.locator('[aria-label*="Location target"]')
+        location_button = page.locator(LOCATION_BUTTON)
         location_button.hover()
 
         # Check tooltip appears with disabled message
-        tooltip = page.locator('[role="tooltip"]')
+        tooltip = page.locator(TOOLTIP)
         expect(tooltip).to_be_visible()
         expect(tooltip).to_contain_text("Location services are disabled")
 
@@ -145,14 +127,12 @@ class TestLocationButtonsDesktopDisabledState:
         Verify suggest new point button shows disabled tooltip when hovering
         and geolocation is not granted.
         """
-        page.goto(BASE_URL, wait_until="domcontentloaded")
-
         # Hover over the suggest button
-        suggest_button = page.locator('[data-testid="suggest-new-point"]')
+        suggest_button = page.locator(SUGGEST_BUTTON)
         suggest_button.hover()
 
         # Check tooltip appears with disabled message
-        tooltip = page.locator('[role="tooltip"]')
+        tooltip = page.locator(TOOLTIP)
         expect(tooltip).to_be_visible()
         expect(tooltip).to_contain_text("Location services are disabled")
 
@@ -161,14 +141,12 @@ class TestLocationButtonsDesktopDisabledState:
         Verify list view button shows disabled tooltip when hovering
         and geolocation is not granted.
         """
-        page.goto(BASE_URL, wait_until="domcontentloaded")
-
         # Hover over the list view button
-        list_view_button = page.locator("#listViewButton")
+        list_view_button = page.locator(LIST_VIEW_BUTTON)
         list_view_button.hover()
 
         # Check tooltip appears with disabled message
-        tooltip = page.locator('[role="tooltip"]')
+        tooltip = page.locator(TOOLTIP)
         expect(tooltip).to_be_visible()
         expect(tooltip).to_contain_text("Location services are disabled")
 
@@ -177,70 +155,94 @@ class TestLocationButtonsDesktopDisabledState:
         Verify all location-dependent buttons have grayed out styling
         when geolocation is not granted.
         """
-        page.goto(BASE_URL, wait_until="domcontentloaded")
+        # Check location, suggest and list view button styling
+        expect_button_styles(page, LOCATION_DEPENDENT_BUTTONS, DISABLED_STYLE)
+
 
-        # Check location button styling
-        location_button = page.locator('[aria-label*="Location target"]')
-        expect(location_button).to_have_css("opacity", "0.6")
-        expect(location_button).to_have_css("filter", "grayscale(1)")
+class TestLocationButtonsDesktopDefaultState:
+    """Test suite for location buttons when no geolocation permission has been answered"""
+
+    @pytest.mark.parametrize(
+        "selector", LOCATION_DEPENDENT_BUTTONS, ids=["location", "suggest", "list-view"]
+    )
+    def test_button_disabled_when_permission_not_granted(self, page: Page, selector: str):
+        """
+        Verify that with the browser's default geolocation state (not granted, no prompt
+        answered) each location-dependent button is grayed out and shows the disabled
+        tooltip on hover.
+        """
+        goto_ready(page, BASE_URL)
 
-        # Check suggest button styling
-        suggest_button = page.locator('[data-testid="suggest-new-point"]')
-        expect(suggest_button).to_have_css("opacity", "0.6")
-        expect(suggest_button).to_have_css("filter", "grayscale(1)")
+        expect_button_styles(page, [selector], DISABLED_STYLE)
 
-        # Check list view button styling
-        list_view_button = page.locator("#listViewButton")
-        expect(list_view_button).to_have_css("opacity", "0.6")
-        expect(list_view_button).to_have_css("filter", "grayscale(1)")
+        page.locator(selector).hover()
+        tooltip = page.locator(TOOLTIP)
+        expect(tooltip).to_be_visible()
+        expect(tooltip).to_contain_text("Location services are disabled")
 
 
 class TestLocationButtonsMobile:
     """Test suite for location buttons on mobile devices"""
 
-    @pytest.mark.parametrize("mobile_page", ALL_MOBILE_DEVICES, indirect=True)
+    @pytest.mark.parametrize(
+        "mobile_page", REPRESENTATIVE_MOBILE_DEVICE + SLOW_MOBILE_DEVICES, indirect=True
+    )
     def test_list_view_shows_tooltip_on_tap(self, mobile_page: Page):
         """
         Verify list view button shows tooltip immediately on tap
         when geolocation is not granted (mobile).
         """
-        mobile_page.goto(BASE_URL, wait_until="domcontentloaded")
+        goto_ready(mobile_page, BASE_URL)
 
         # Tap the list view button
-        list_view_button = mobile_page.locator("#listViewButton")
+        list_view_button = mobile_page.locator(LIST_VIEW_BUTTON)
         list_view_button.wait_for(state="visible")
         list_view_button.click()
 
         # Check tooltip appears with disabled message
-        tooltip = mobile_page.locator('[role="tooltip"]')
+        tooltip = mobile_page.locator(TOOLTIP)
         expect(tooltip).to_be_visible()
         expect(tooltip).to_contain_text("Location services are disabled")
 
-    @pytest.mark.parametrize("mobile_page", ALL_MOBILE_DEVICES, indirect=True)
+    @pytest.mark.parametrize(
+        "mobile_page", REPRESENTATIVE_MOBILE_DEVICE + SLOW_MOBILE_DEVICES, indirect=True
+    )
     def test_all_buttons_show_tooltip_on_tap(self, mobile_page: Page):
         """
         Verify all three location buttons show tooltips consistently on tap (mobile).
         Tests that enterTouchDelay=0 is working for all buttons.
         """
-        mobile_page.goto(BASE_URL, wait_until="domcontentloaded")
+        goto_ready(mobile_page, BASE_URL)
 
-        buttons = [
-            ("#listViewButton", "List View"),
-            ('[aria-label*="Location target"]', "Location"),
-            ('[data-testid="suggest-new-point"]', "Suggest"),
-        ]
-
-        for selector, _name in buttons:
+        for selector in LOCATION_DEPENDENT_BUTTONS:
             # Tap the button
             button = mobile_page.locator(selector)
             button.wait_for(state="visible")
             button.click()
 
-            # Check tooltip appears
-            tooltip = mobile_page.locator('[role="tooltip"]')
-            expect(tooltip).to_be_visible(timeout=2000)
-            expect(tooltip).to_contain_text("Location services are disabled")
-
-            # Click elsewhere to dismiss tooltip and wait for it to disappear
+            # Check tooltip appears with the disabled message, in a single in-page wait
+            try:
+                mobile_page.wait_for_function(
+                    """text => {
+                        const tooltip = document.querySelector('[role="tooltip"]');
+                        return !!tooltip && tooltip.checkVisibility()
+                            && tooltip.textContent.includes(text);
+                    }""",
+                    arg="Location services are disabled",
+                    timeout=2000,
+                )
+            except PlaywrightTimeoutError:
+                raise AssertionError(
+                    f"No visible disabled tooltip after tapping {selector}"
+                ) from None
+
+            # Click elsewhere to dismiss tooltip and wait until it is unmounted
             mobile_page.locator("body").click(position={"x": 10, "y": 10})
-            expect(tooltip).not_to_be_visible(timeout=2000)
+            try:
+                mobile_page.wait_for_function(
+                    "() => !document.querySelector('[role=\"tooltip\"]')", timeout=2000
+                )
+            except PlaywrightTimeoutError:
+                raise AssertionError(
+                    f"Tooltip of {selector} was not dismissed by tapping elsewhere"
+                ) from None
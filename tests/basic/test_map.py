@@ -7,32 +7,32 @@ Tests basic map functionality including filter list and layout.
 import pytest
 from playwright.sync_api import Page, expect
 
-from tests.conftest import BASE_URL
+from tests.conftest import BASE_URL, MARKER_LOAD_TIMEOUT
+from tests.helpers import goto_ready, wait_for_marker_count
 
 
 class TestMap:
-    """Test suite for map functionality"""
+    """
+    Test suite for map functionality.
 
-    @pytest.fixture(autouse=True)
-    def setup(self, page: Page):
-        """Navigate to home page before each test"""
-        page.goto(BASE_URL, wait_until="domcontentloaded")
-        return
+    The read-only tests share one loaded page (loaded_desktop_page). The filter test
+    zooms the map by expanding a cluster, so it gets its own page.
+    """
 
-    def test_displays_filter_list_with_two_categories_with_5_items(self, page: Page):
+    def test_displays_filter_list_with_two_categories_with_5_items(self, loaded_desktop_page: Page):
         """Verify filter list has correct number of checkboxes and category groups"""
         # Check number of checkboxes (5 filter options)
-        checkboxes = page.get_by_role("checkbox")
+        checkboxes = loaded_desktop_page.get_by_role("checkbox")
         expect(checkboxes).to_have_count(5)
 
         # Check that both category groups are present (using translated names)
-        expect(page.get_by_text("accessible by")).to_be_visible()
-        expect(page.get_by_text("type of place")).to_be_visible()
+        expect(loaded_desktop_page.get_by_text("accessible by")).to_be_visible()
+        expect(loaded_desktop_page.get_by_text("type of place")).to_be_visible()
 
-    def test_should_not_have_scrollbars(self, page: Page):
+    def test_should_not_have_scrollbars(self, loaded_desktop_page: Page):
         """Verify the page has no horizontal or vertical scrollbars"""
         # Get viewport and document dimensions
-        dimensions = page.evaluate(
+        dimensions = loaded_desktop_page.evaluate(
             """
             () => {
                 return {
@@ -58,8 +58,11 @@ class TestMap:
             f"innerHeight={dimensions['innerHeight']}"
         )
 
+    @pytest.mark.usefixtures("no_external_resources")
     def test_filter_checkbox_filters_markers(self, page: Page):
         """Verify clicking filter checkbox actually filters the markers on the map"""
+        goto_ready(page, BASE_URL)
+
         # Wait for markers to load
         first_marker = page.locator(".leaflet-marker-icon").first
         expect(first_marker).to_be_visible(timeout=5000)
@@ -68,8 +71,7 @@ class TestMap:
         first_marker.click()
 
         # Wait for markers to expand - should be 2 markers after expansion
-        markers = page.locator(".leaflet-marker-icon")
-        expect(markers).to_have_count(2)
+        wait_for_marker_count(page, 2, timeout=MARKER_LOAD_TIMEOUT)
 
         # On desktop, filter panel is already visible (no toggle needed)
 
@@ -79,10 +81,10 @@ class TestMap:
         cars_checkbox.click()
 
         # After filtering, only 1 marker should be visible (the one accessible by cars)
-        expect(markers).to_have_count(1)
+        wait_for_marker_count(page, 1, timeout=MARKER_LOAD_TIMEOUT)
 
         # Uncheck to restore all markers
         cars_checkbox.click()
 
         # Both markers should be visible again
-        expect(markers).to_have_count(2)
+        wait_for_marker_count(page, 2, timeout=MARKER_LOAD_TIMEOUT)
@@ -9,14 +9,25 @@ information as a bottom sheet that slides up from the bottom.
 import pytest
 from playwright.sync_api import Page, expect
 
-from tests.conftest import ALL_MOBILE_DEVICES, BASE_URL
-from tests.helpers import EXPECTED_PLACE_ZWIERZYNIECKA, verify_popup_content, verify_problem_form
+from tests.conftest import (
+    BASE_URL,
+    MARKER_LOAD_TIMEOUT,
+    REPRESENTATIVE_MOBILE_DEVICE,
+    SLOW_MOBILE_DEVICES,
+)
+from tests.helpers import (
+    EXPECTED_PLACE_ZWIERZYNIECKA,
+    expand_cluster_and_click_rightmost_marker,
+    get_mobile_popup,
+    verify_popup_content,
+    verify_problem_form,
+)
 
 
 class TestPopupOnMobile:
     """Test suite for popup functionality on mobile devices"""
 
-    @pytest.mark.parametrize("device_name", ALL_MOBILE_DEVICES)
+    @pytest.mark.parametrize("device_name", REPRESENTATIVE_MOBILE_DEVICE + SLOW_MOBILE_DEVICES)
     def test_displays_title_and_subtitle_in_popup(
         self, mobile_page: Page, mobile_window_open_stub, device_name: str
     ):
@@ -27,45 +38,16 @@ class TestPopupOnMobile:
         Mobile uses MobilePopup component which renders as a Material-UI Dialog
         that slides up from the bottom like a bottom sheet.
 
-        Tests on all mobile devices: iphone-x, iphone-6, ipad-2, samsung-s10
+        Runs on iphone-x by default; iphone-6, ipad-2 and samsung-s10 are marked slow.
         """
         # Navigate to the page (device emulation already configured by mobile_page fixture)
-        mobile_page.goto(BASE_URL, wait_until="domcontentloaded")
+        mobile_page.goto(BASE_URL, wait_until="commit")
 
-        # Click first marker to expand cluster
-        # Use JavaScript click to bypass webpack overlay that may intercept clicks on CI
-        first_marker = mobile_page.locator(".leaflet-marker-icon").first
-        first_marker.evaluate("el => el.click()")
-
-        # Wait for markers to appear (should be 2 after expansion)
-        markers = mobile_page.locator(".leaflet-marker-icon")
-        expect(markers).to_have_count(2)
-
-        # Click the rightmost marker
-        mobile_page.evaluate(
-            """
-            () => {
-                const markers = document.querySelectorAll('.leaflet-marker-icon');
-                let rightmostMarker = null;
-                let maxX = -Infinity;
-
-                markers.forEach(marker => {
-                    const rect = marker.getBoundingClientRect();
-                    if (rect.x > maxX) {
-                        maxX = rect.x;
-                        rightmostMarker = marker;
-                    }
-                });
-
-                if (rightmostMarker) {
-                    rightmostMarker.click();
-                }
-            }
-        """
-        )
+        # Expand the cluster and click the rightmost of its two markers
+        expand_cluster_and_click_rightmost_marker(mobile_page, timeout=MARKER_LOAD_TIMEOUT)
 
         # On mobile, popup appears as Material-UI Dialog (bottom sheet)
-        dialog_content = mobile_page.locator(".MuiDialogContent-root")
+        dialog_content = get_mobile_popup(mobile_page)
         expect(dialog_content).to_be_visible(timeout=5000)
 
         # Verify popup content
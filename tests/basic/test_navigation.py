@@ -10,8 +10,10 @@ Tests navigation bar functionality including:
 
 import pytest
 from playwright.sync_api import Page, expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from tests.conftest import BASE_URL, MOBILE_DEVICES, UI_VERTICAL_ALIGNMENT_TOLERANCE
+from tests.helpers import get_left_panel, goto_ready
 
 
 class TestNavigationMenu:
@@ -20,7 +22,7 @@ class TestNavigationMenu:
     @pytest.fixture(autouse=True)
     def setup(self, page: Page):
         """Navigate to home page before each test"""
-        page.goto(BASE_URL, wait_until="domcontentloaded")
+        goto_ready(page, BASE_URL)
         return
 
     def test_navigation_menu_opens_and_shows_links(self, page: Page):
@@ -90,27 +92,39 @@ class TestNavigationBarForSmallDevices:
         Tests on: iphone-6, ipad-2, samsung-s10
         """
         # Navigate after viewport is set (mobile_page fixture sets viewport before page creation)
-        mobile_page.goto(BASE_URL, wait_until="domcontentloaded")
-
-        # Get logo position and center
-        logo = mobile_page.locator(".navbar-brand")
-        expect(logo).to_be_visible()
-        logo_box = logo.bounding_box()
-        assert logo_box is not None, "Logo not found"
+        goto_ready(mobile_page, BASE_URL)
+
+        # Wait for the logo and every hamburger to render
+        expect(mobile_page.locator(".navbar-brand")).to_be_visible()
+        try:
+            mobile_page.wait_for_function(
+                """() => {
+                    const hamburgers = [...document.querySelectorAll('.navbar-toggler')];
+                    return hamburgers.length > 0 && hamburgers.every(el => el.checkVisibility());
+                }""",
+                timeout=5000,
+            )
+        except PlaywrightTimeoutError:
+            raise AssertionError(f"Hamburger menus not all visible on {device_name}") from None
+
+        # Read the logo and all hamburger positions in a single round trip
+        layout = mobile_page.evaluate(
+            """() => {
+                const center = rect => rect.top + rect.height / 2;
+                const logo = document.querySelector('.navbar-brand');
+                const hamburgers = [...document.querySelectorAll('.navbar-toggler')];
+                return {
+                    logoCenter: center(logo.getBoundingClientRect()),
+                    hamburgers: hamburgers.map(el => center(el.getBoundingClientRect()))
+                };
+            }"""
+        )
 
-        logo_center = logo_box["y"] + logo_box["height"] / 2
+        logo_center = layout["logoCenter"]
         print(f"Logo Center: {logo_center}")
 
         # Check each hamburger menu center position
-        hamburger_locator = mobile_page.locator(".navbar-toggler")
-        expect(hamburger_locator.first).to_be_visible()
-        hamburgers = hamburger_locator.all()
-        for i, hamburger in enumerate(hamburgers):
-            expect(hamburger).to_be_visible()
-            hamburger_box = hamburger.bounding_box()
-            assert hamburger_box is not None, f"Hamburger {i+1} not found"
-
-            hamburger_center = hamburger_box["y"] + hamburger_box["height"] / 2
+        for i, hamburger_center in enumerate(layout["hamburgers"]):
             print(f"Hamburger Center {i+1}: {hamburger_center}")
 
             # Verify vertical alignment within tolerance
@@ -131,10 +145,10 @@ class TestNavigationBarForSmallDevices:
         Tests on: iphone-6, ipad-2, samsung-s10
         """
         # Navigate after viewport is set (mobile_page fixture sets viewport before page creation)
-        mobile_page.goto(BASE_URL, wait_until="domcontentloaded")
+        goto_ready(mobile_page, BASE_URL)
 
         # Verify left panel is not visible initially
-        left_panel = mobile_page.locator("#left-panel")
+        left_panel = get_left_panel(mobile_page)
         expect(left_panel).not_to_be_visible()
 
         # Click first (left) hamburger button
@@ -143,21 +157,27 @@ class TestNavigationBarForSmallDevices:
         # Verify left panel is now visible
         expect(left_panel).to_be_visible()
 
-        # Get filter form position
-        filter_form = mobile_page.locator("#filter-form")
-        expect(filter_form).to_be_visible()
+        # Wait for the filter form inside the opened panel
+        expect(mobile_page.locator("#filter-form")).to_be_visible()
+
+        # Read filter form and navbar positions in a single round trip
+        layout = mobile_page.evaluate(
+            """() => {
+                const navbar = document.querySelector('.navbar');
+                const navbarRect = navbar.getBoundingClientRect();
+                const filterForm = document.querySelector('#filter-form');
+                return {
+                    filterFormTop: filterForm.getBoundingClientRect().top,
+                    navbarVisible: navbar.checkVisibility(),
+                    navbarBottom: navbarRect.top + navbarRect.height
+                };
+            }"""
+        )
+        assert layout["navbarVisible"], "Navbar not visible"
 
-        filter_form_box = filter_form.bounding_box()
-        assert filter_form_box is not None, "Filter form not found"
-        filter_form_top = filter_form_box["y"]
+        filter_form_top = layout["filterFormTop"]
         print(f"Filter Form Top: {filter_form_top}")
-
-        # Get navbar bottom position
-        navbar = mobile_page.locator(".navbar")
-        expect(navbar).to_be_visible()
-        navbar_box = navbar.bounding_box()
-        assert navbar_box is not None, "Navbar not found"
-        navbar_bottom = navbar_box["y"] + navbar_box["height"]
+        navbar_bottom = layout["navbarBottom"]
         print(f"Navbar Bottom: {navbar_bottom}")
 
         # Verify filter form is below navbar
@@ -7,7 +7,17 @@ Tests popup functionality including content display, CTA buttons, and problem fo
 from playwright.sync_api import Page, expect
 
 from tests.conftest import BASE_URL, MARKER_LOAD_TIMEOUT
-from tests.helpers import EXPECTED_PLACE_ZWIERZYNIECKA, verify_popup_content, verify_problem_form
+from tests.helpers import (
+    EXPECTED_PLACE_ZWIERZYNIECKA,
+    POPUP_CLOSE_BUTTON_SELECTOR,
+    POPUP_SELECTOR,
+    expand_cluster_and_click_rightmost_marker,
+    get_popup,
+    get_popup_close_button,
+    verify_popup_content,
+    verify_problem_form,
+    wait_for_all_visible,
+)
 
 
 class TestPopupOnDesktop:
@@ -20,50 +30,24 @@ class TestPopupOnDesktop:
         Note: There's a TODO/BUG in the original test - problem form testing is
         skipped because the close button may be hidden when form is opened on desktop.
         """
-        page.goto(BASE_URL, wait_until="domcontentloaded")
-
-        # Click first marker to trigger cluster expansion
-        first_marker = page.locator(".leaflet-marker-icon").first
-        first_marker.click()
-
-        # Wait for markers to appear (should be 2 after cluster expansion)
-        markers = page.locator(".leaflet-marker-icon")
-        expect(markers).to_have_count(2, timeout=MARKER_LOAD_TIMEOUT)
-
-        # Click the rightmost marker
-        # Note: Using evaluate to find rightmost marker since we don't have data-testid
-        page.evaluate(
-            """
-            () => {
-                const markers = document.querySelectorAll('.leaflet-marker-icon');
-                let rightmostMarker = null;
-                let maxX = -Infinity;
-
-                markers.forEach(marker => {
-                    const rect = marker.getBoundingClientRect();
-                    if (rect.x > maxX) {
-                        maxX = rect.x;
-                        rightmostMarker = marker;
-                    }
-                });
-
-                if (rightmostMarker) {
-                    rightmostMarker.click();
-                }
-            }
-        """
+        page.goto(BASE_URL, wait_until="commit")
+
+        # Expand the cluster and click the rightmost of its two markers
+        expand_cluster_and_click_rightmost_marker(page, timeout=MARKER_LOAD_TIMEOUT)
+
+        # Wait for the popup and its close button together
+        wait_for_all_visible(
+            page,
+            [POPUP_SELECTOR, POPUP_CLOSE_BUTTON_SELECTOR],
+            timeout=MARKER_LOAD_TIMEOUT,
         )
 
         # Verify popup content
-        popup = page.locator(".leaflet-popup-content")
-        expect(popup).to_be_visible()
-
         verify_popup_content(page, EXPECTED_PLACE_ZWIERZYNIECKA)
 
-        # Verify close button and click it
-        close_button = page.locator(".leaflet-popup-close-button")
-        expect(close_button).to_be_visible()
-        close_button.click()
+        # Click the close button
+        popup = get_popup(page)
+        get_popup_close_button(page).click()
 
         # Verify popup is closed
         expect(popup).not_to_be_visible()
@@ -78,41 +62,13 @@ class TestPopupOnDesktop:
         - Selecting 'other' shows text input
         - Form submission works
         """
-        page.goto(BASE_URL, wait_until="domcontentloaded")
-
-        # Click first marker to trigger cluster expansion
-        first_marker = page.locator(".leaflet-marker-icon").first
-        first_marker.click()
-
-        # Wait for markers to appear (should be 2 after cluster expansion)
-        markers = page.locator(".leaflet-marker-icon")
-        expect(markers).to_have_count(2, timeout=MARKER_LOAD_TIMEOUT)
-
-        # Click the rightmost marker
-        page.evaluate(
-            """
-            () => {
-                const markers = document.querySelectorAll('.leaflet-marker-icon');
-                let rightmostMarker = null;
-                let maxX = -Infinity;
-
-                markers.forEach(marker => {
-                    const rect = marker.getBoundingClientRect();
-                    if (rect.x > maxX) {
-                        maxX = rect.x;
-                        rightmostMarker = marker;
-                    }
-                });
-
-                if (rightmostMarker) {
-                    rightmostMarker.click();
-                }
-            }
-        """
-        )
+        page.goto(BASE_URL, wait_until="commit")
+
+        # Expand the cluster and click the rightmost of its two markers
+        expand_cluster_and_click_rightmost_marker(page, timeout=MARKER_LOAD_TIMEOUT)
 
         # Verify popup is visible
-        popup = page.locator(".leaflet-popup-content")
+        popup = get_popup(page)
         expect(popup).to_be_visible()
 
         # Verify problem form
@@ -11,6 +11,14 @@ import pytest
 from playwright.sync_api import Page, expect
 
 from tests.conftest import ALL_MOBILE_DEVICES, BASE_URL, MARKER_LOAD_TIMEOUT
+from tests.helpers import (
+    POPUP_SELECTOR,
+    expand_cluster_and_click_rightmost_marker,
+    get_mobile_popup,
+    get_popup,
+    goto_ready,
+    wait_for_all_visible,
+)
 
 
 class TestShareOnDesktop:
@@ -21,48 +29,20 @@ class TestShareOnDesktop:
         Verify clicking the share button copies a locationId link to clipboard
         and shows a toast notification.
         """
-        page.goto(BASE_URL, wait_until="domcontentloaded")
+        page.goto(BASE_URL, wait_until="commit")
 
         # Grant clipboard permissions
         page.context.grant_permissions(["clipboard-read", "clipboard-write"])
 
-        # Click first marker to trigger cluster expansion
-        first_marker = page.locator(".leaflet-marker-icon").first
-        first_marker.click()
-
-        # Wait for markers to appear (should be 2 after cluster expansion)
-        markers = page.locator(".leaflet-marker-icon")
-        expect(markers).to_have_count(2, timeout=MARKER_LOAD_TIMEOUT)
-
-        # Click the rightmost marker
-        page.evaluate(
-            """
-            () => {
-                const markers = document.querySelectorAll('.leaflet-marker-icon');
-                let rightmostMarker = null;
-                let maxX = -Infinity;
-
-                markers.forEach(marker => {
-                    const rect = marker.getBoundingClientRect();
-                    if (rect.x > maxX) {
-                        maxX = rect.x;
-                        rightmostMarker = marker;
-                    }
-                });
-
-                if (rightmostMarker) {
-                    rightmostMarker.click();
-                }
-            }
-        """
-        )
+        # Expand the cluster and click the rightmost of its two markers
+        expand_cluster_and_click_rightmost_marker(page, timeout=MARKER_LOAD_TIMEOUT)
 
         # Verify popup is visible
-        popup = page.locator(".leaflet-popup-content")
+        popup = get_popup(page)
         expect(popup).to_be_visible()
 
-        # Click the share button
-        share_button = page.get_by_role("button", name="share")
+        # Click the share button (role query scoped to the popup, not the whole page)
+        share_button = page.locator(".leaflet-popup").get_by_role("button", name="share")
         expect(share_button).to_be_visible()
         share_button.click()
 
@@ -79,13 +59,14 @@ class TestShareOnDesktop:
         Verify navigating to a URL with ?locationId= auto-opens the popup
         with the correct location content.
         """
-        page.goto(f"{BASE_URL}/?locationId=dattarro", wait_until="domcontentloaded")
+        # Wait for the app to mount (up to 30s) before the 5s popup wait below
+        goto_ready(page, f"{BASE_URL}/?locationId=dattarro")
 
-        # Verify popup is visible
-        popup = page.locator(".leaflet-popup-content")
-        expect(popup).to_be_visible(timeout=MARKER_LOAD_TIMEOUT)
+        # Wait in the page for the popup to open (no cluster expansion needed)
+        wait_for_all_visible(page, [POPUP_SELECTOR], timeout=MARKER_LOAD_TIMEOUT)
 
         # Verify popup shows correct location
+        popup = get_popup(page)
         title = popup.locator("h3")
         expect(title).to_have_text("Zwierzyniecka")
 
@@ -114,45 +95,17 @@ class TestShareOnMobile:
         """
         )
 
-        mobile_page.goto(BASE_URL, wait_until="domcontentloaded")
+        mobile_page.goto(BASE_URL, wait_until="commit")
 
-        # Click first marker to expand cluster
-        first_marker = mobile_page.locator(".leaflet-marker-icon").first
-        first_marker.evaluate("el => el.click()")
-
-        # Wait for markers to appear (should be 2 after expansion)
-        markers = mobile_page.locator(".leaflet-marker-icon")
-        expect(markers).to_have_count(2, timeout=MARKER_LOAD_TIMEOUT)
-
-        # Click the rightmost marker
-        mobile_page.evaluate(
-            """
-            () => {
-                const markers = document.querySelectorAll('.leaflet-marker-icon');
-                let rightmostMarker = null;
-                let maxX = -Infinity;
-
-                markers.forEach(marker => {
-                    const rect = marker.getBoundingClientRect();
-                    if (rect.x > maxX) {
-                        maxX = rect.x;
-                        rightmostMarker = marker;
-                    }
-                });
-
-                if (rightmostMarker) {
-                    rightmostMarker.click();
-                }
-            }
-        """
-        )
+        # Expand the cluster and click the rightmost of its two markers
+        expand_cluster_and_click_rightmost_marker(mobile_page, timeout=MARKER_LOAD_TIMEOUT)
 
         # On mobile, popup appears as Material-UI Dialog
-        dialog_content = mobile_page.locator(".MuiDialogContent-root")
+        dialog_content = get_mobile_popup(mobile_page)
         expect(dialog_content).to_be_visible(timeout=5000)
 
-        # Click the share button
-        share_button = mobile_page.get_by_role("button", name="share")
+        # Click the share button (role query scoped to the dialog, not the whole page)
+        share_button = mobile_page.locator('[role="dialog"]').get_by_role("button", name="share")
         expect(share_button).to_be_visible()
         share_button.evaluate("el => el.click()")
 
@@ -168,10 +121,11 @@ class TestShareOnMobile:
 
         Tests on all mobile devices: iphone-x, iphone-6, ipad-2, samsung-s10
         """
-        mobile_page.goto(f"{BASE_URL}/?locationId=dattarro", wait_until="domcontentloaded")
+        # Wait for the app to mount (up to 30s) before the 5s popup wait below
+        goto_ready(mobile_page, f"{BASE_URL}/?locationId=dattarro")
 
         # On mobile, popup appears as Material-UI Dialog
-        dialog_content = mobile_page.locator(".MuiDialogContent-root")
+        dialog_content = get_mobile_popup(mobile_page)
         expect(dialog_content).to_be_visible(timeout=MARKER_LOAD_TIMEOUT)
 
         # Verify popup shows correct location
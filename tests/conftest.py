@@ -2,107 +2,443 @@
 Pytest fixtures and configuration for Playwright E2E tests.
 
 Provides custom fixtures for:
-- Webpack script caching and interception
+- Frontend asset (webpack bundle) caching and HMR blocking
 - Window.open() stub tracking
 - Geolocation mocking
 - Performance tracking for stress tests
 """
 
+import hashlib
 import json
-from collections.abc import Callable, Generator
+import os
+import re
+import time
+from array import array
+from collections.abc import Callable, Generator, Mapping
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import pytest
-from playwright.sync_api import BrowserContext, Page
+from playwright.sync_api import Browser, BrowserContext, Page, Route, expect
+
+from tests.helpers import goto_ready, switch_to_language
 
 BASE_URL = "http://localhost:5000"
 
+# Static assets served by the goodmap-frontend dev server (GOODMAP_FRONTEND_LIB_URL)
+FRONTEND_ASSET_PATTERN = re.compile(r"^http://localhost:8080/.*\.(?:js|css)(?:\?.*)?$")
+
+# Response headers that describe the dev server's encoded transfer rather than the
+# decoded body route.fetch() returns, so they are not replayed from the asset cache
+TRANSFER_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+# HMR websocket and hot-update chunk requests from the frontend dev server
+HMR_URL_PATTERN = re.compile(r"/ws$|\.hot-update\.")
+
+# Third-party resources the app loads: map tiles and the Google Fonts stylesheet/files
+EXTERNAL_RESOURCE_PATTERN = re.compile(
+    r"^https://(?:[abc]\.tile\.openstreetmap\.org|fonts\.googleapis\.com|fonts\.gstatic\.com)/"
+)
+
 MARKER_LOAD_TIMEOUT = 5000
 TABLE_LOAD_TIMEOUT = 5000
 
-MOBILE_DEVICES = {
-    "iphone-x": {
-        "viewport": {"width": 375, "height": 812},
-        "user_agent": (
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 11_0 like Mac OS X) "
-            "AppleWebKit/604.1.38 (KHTML, like Gecko) "
-            "Version/11.0 Mobile/15A372 Safari/604.1"
+DESKTOP_VIEWPORT = {"width": 1280, "height": 800}
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceConfig:
+    """Browser context settings that emulate a mobile device."""
+
+    viewport: dict[str, int]
+    user_agent: str
+    has_touch: bool = True
+
+
+# Read-only, so a test cannot change a device profile for the tests that run after it
+MOBILE_DEVICES: Mapping[str, DeviceConfig] = MappingProxyType(
+    {
+        "iphone-x": DeviceConfig(
+            viewport={"width": 375, "height": 812},
+            user_agent=(
+                "Mozilla/5.0 (iPhone; CPU iPhone OS 11_0 like Mac OS X) "
+                "AppleWebKit/604.1.38 (KHTML, like Gecko) "
+                "Version/11.0 Mobile/15A372 Safari/604.1"
+            ),
         ),
-    },
-    "iphone-6": {
-        "viewport": {"width": 375, "height": 667},
-        "user_agent": (
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 11_0 like Mac OS X) "
-            "AppleWebKit/604.1.38 (KHTML, like Gecko) "
-            "Version/11.0 Mobile/15A372 Safari/604.1"
+        "iphone-6": DeviceConfig(
+            viewport={"width": 375, "height": 667},
+            user_agent=(
+                "Mozilla/5.0 (iPhone; CPU iPhone OS 11_0 like Mac OS X) "
+                "AppleWebKit/604.1.38 (KHTML, like Gecko) "
+                "Version/11.0 Mobile/15A372 Safari/604.1"
+            ),
         ),
-    },
-    "ipad-2": {
-        "viewport": {"width": 768, "height": 1024},
-        "user_agent": (
-            "Mozilla/5.0 (iPad; CPU OS 11_0 like Mac OS X) "
-            "AppleWebKit/604.1.34 (KHTML, like Gecko) "
-            "Version/11.0 Mobile/15A5341f Safari/604.1"
+        "ipad-2": DeviceConfig(
+            viewport={"width": 768, "height": 1024},
+            user_agent=(
+                "Mozilla/5.0 (iPad; CPU OS 11_0 like Mac OS X) "
+                "AppleWebKit/604.1.34 (KHTML, like Gecko) "
+                "Version/11.0 Mobile/15A5341f Safari/604.1"
+            ),
         ),
-    },
-    "samsung-s10": {
-        "viewport": {"width": 360, "height": 760},
-        "user_agent": (
-            "Mozilla/5.0 (Linux; Android 9; SAMSUNG SM-G973U) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "SamsungBrowser/9.2 Chrome/67.0.3396.87 Mobile Safari/537.36"
+        "samsung-s10": DeviceConfig(
+            viewport={"width": 360, "height": 760},
+            user_agent=(
+                "Mozilla/5.0 (Linux; Android 9; SAMSUNG SM-G973U) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "SamsungBrowser/9.2 Chrome/67.0.3396.87 Mobile Safari/537.36"
+            ),
         ),
-    },
-}
+    }
+)
 
 ALL_MOBILE_DEVICES = list(MOBILE_DEVICES.keys())
 
+# Tap/tooltip and popup behaviour does not depend on the screen size, so those tests run on one
+# device by default. The other devices are marked slow and only run with `-m slow`
+# (or with no marker filter at all, for the full matrix).
+REPRESENTATIVE_MOBILE_DEVICE = ["iphone-x"]
+SLOW_MOBILE_DEVICES = [
+    pytest.param(device, marks=pytest.mark.slow)
+    for device in ALL_MOBILE_DEVICES
+    if device not in REPRESENTATIVE_MOBILE_DEVICE
+]
+
 UI_VERTICAL_ALIGNMENT_TOLERANCE = 3
 
-TEST_LOCATIONS = {
-    "RYSY_MOUNTAIN": {
-        "lat": 49.179,
-        "lon": 20.088,
-        "tile_pattern": r"https://[abc]\.tile\.openstreetmap\.org/1[456]/\d+/\d+\.png",
-    },
-    "WROCLAW_CENTER": {"lat": 51.10655, "lon": 17.0555},
-}
+# Init script that makes the geolocation API fail with PERMISSION_DENIED
+GEOLOCATION_DENIED_SCRIPT = """
+    // Override geolocation to simulate denied permission
+    Object.defineProperty(navigator, 'geolocation', {
+        value: {
+            getCurrentPosition: function(success, error) {
+                // Simulate permission denied error
+                if (error) {
+                    error({
+                        code: 1,  // PERMISSION_DENIED
+                        message: 'User denied geolocation'
+                    });
+                }
+            },
+            watchPosition: function() { return 0; },
+            clearWatch: function() {}
+        },
+        writable: false
+    });
+"""
+
+# Init script that records window.open() URLs in the page instead of opening a window
+# (see _stub_window_open)
+WINDOW_OPEN_STUB_SCRIPT = """
+    window.__openedUrls = [];
+    window.open = function(url, target, features) {
+        window.__openedUrls.push(url);
+        return null;
+    };
+"""
+
+# Clears the app origin's web storage; IndexedDB deletions that are blocked by the
+# page's open connections complete once the page is closed
+CLEAR_WEB_STORAGE_SCRIPT = """async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    const databases = await indexedDB.databases();
+    await Promise.all(databases.map(({name}) => new Promise(resolve => {
+        const request = indexedDB.deleteDatabase(name);
+        request.onsuccess = request.onerror = request.onblocked = resolve;
+    })));
+}"""
+
+TEST_LOCATIONS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "RYSY_MOUNTAIN": MappingProxyType(
+            {
+                "lat": 49.179,
+                "lon": 20.088,
+                "tile_pattern": r"https://[abc]\.tile\.openstreetmap\.org/1[456]/\d+/\d+\.png",
+            }
+        ),
+        "WROCLAW_CENTER": MappingProxyType({"lat": 51.10655, "lon": 17.0555}),
+    }
+)
+
+
+def _block_hmr(context: BrowserContext) -> None:
+    """
+    Block HMR/hot reload requests to prevent page refreshes during tests.
+
+    Registered once per context with a single pattern, so it covers every page opened
+    in the context. Call it after _serve_cached_assets: the most recently registered
+    route wins, so hot-update chunks are aborted rather than cached.
+
+    context.route() only sees HTTP requests, so the HMR websocket is routed separately.
+    Its handler never connects to the dev server: the page gets an open socket that
+    stays silent, so the HMR client does not keep reconnecting either.
+    """
+    context.route(HMR_URL_PATTERN, lambda route: route.abort())
+    context.route_web_socket(HMR_URL_PATTERN, lambda ws: None)
+
+
+def _serve_cached_assets(context: BrowserContext, cache: dict) -> None:
+    """
+    Serve frontend assets from ``cache``, fetching each one over the network only once.
+
+    Entries hold route.fulfill() arguments: a ``body`` for assets fetched by this
+    worker, or a ``path`` for assets read from the shared on-disk cache. The body is
+    stored decoded, so the TRANSFER_HEADERS that describe the encoded one are dropped.
+    """
+
+    def handle(route: Route) -> None:
+        url = route.request.url
+        if url not in cache:
+            response = route.fetch()
+            if not response.ok:
+                route.fulfill(response=response)
+                return
+            cache[url] = {
+                "status": response.status,
+                "headers": {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() not in TRANSFER_HEADERS
+                },
+                "body": response.body(),
+            }
+        route.fulfill(**cache[url])
 
+    context.route(FRONTEND_ASSET_PATTERN, handle)
 
-def _block_hmr(page: Page) -> None:
-    """Block HMR/hot reload requests to prevent page refreshes during tests."""
-    page.route("**/ws", lambda route: route.abort())
-    page.route("**/*.hot-update.*", lambda route: route.abort())
+
+def _new_page(context: BrowserContext, asset_cache: dict) -> Page:
+    """Open a page in ``context`` that serves cached frontend assets and blocks HMR."""
+    _serve_cached_assets(context, asset_cache)
+    _block_hmr(context)
+    return context.new_page()
 
 
 def _stub_window_open(page: Page) -> Callable[[], list[str]]:
-    """Stub window.open() and return a callable that retrieves opened URLs."""
-    opened_urls = []
-    page.expose_function("__captureWindowOpen", lambda url: opened_urls.append(url))
-    page.add_init_script(
-        """
-        window.open = function(url, target, features) {
-            window.__captureWindowOpen(url);
-            return null;
-        };
     """
-    )
-    return lambda: opened_urls.copy()
+    Stub window.open() and return a callable that retrieves opened URLs.
+
+    The URLs are kept in the page (like navigator.share() calls in the share tests),
+    so window.open() does not call back into Python; the callable reads them in one
+    evaluate(). They are kept per document, so a navigation starts a new list.
+    """
+    page.add_init_script(WINDOW_OPEN_STUB_SCRIPT)
+    return lambda: page.evaluate("() => window.__openedUrls.slice()")
+
+
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args: dict) -> dict:
+    """
+    Extend the default Playwright browser launch arguments.
+
+    Chromium keeps shared memory in /dev/shm, which is small in Docker and CI
+    containers; --disable-dev-shm-usage makes it use /tmp instead so parallel
+    workers do not crash or slow down when /dev/shm fills up.
+    """
+    args = [*browser_type_launch_args.get("args", []), "--disable-dev-shm-usage"]
+    return {**browser_type_launch_args, "args": args}
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args: dict) -> dict:
+    """
+    Extend the default Playwright context arguments.
+
+    pytest-playwright launches one browser per session (per xdist worker) and creates
+    a fresh context for every test from these arguments. Creating the context at the
+    desktop viewport size (1280x800) avoids resizing every page after it is opened.
+    Individual tests can still override it with @pytest.mark.browser_context_args.
+    """
+    return {**browser_context_args, "viewport": DESKTOP_VIEWPORT}
+
+
+def _write_asset_cache(directory: Path, cache: dict) -> dict:
+    """
+    Write the bodies in ``cache`` to files in ``directory`` and publish a manifest.
+
+    Returns the cache with each body replaced by the path of its file, so assets are
+    fulfilled from disk. The manifest is written last and renamed into place, so
+    other workers never read a partial one.
+    """
+    manifest = {}
+    for url, entry in cache.items():
+        path = directory / hashlib.sha1(url.encode()).hexdigest()
+        path.write_bytes(entry["body"])
+        manifest[url] = {"status": entry["status"], "headers": entry["headers"], "path": str(path)}
+    tmp_path = directory / "manifest.json.tmp"
+    tmp_path.write_text(json.dumps(manifest))
+    tmp_path.replace(directory / "manifest.json")
+    return manifest
+
+
+@pytest.fixture(scope="session")
+def frontend_asset_cache(browser: Browser, tmp_path_factory: pytest.TempPathFactory) -> dict:
+    """
+    Cache of frontend assets shared by all tests, and by all xdist workers, of a run.
+
+    The frontend bundle does not change during a test run, so it only needs to be
+    downloaded from the dev server once instead of once per test. The first worker
+    warms the cache by loading the app in a throwaway context (so the first test
+    does not pay the cold dev-server fetch inside its own assertion timeouts) and
+    writes the assets to the run's temp directory; the other workers wait for its
+    manifest and serve the same files. If warming fails, the first worker leaves a
+    marker so the others stop waiting and warm their own caches (failing with their
+    own error if the dev server is down). Assets requested later (e.g. lazy chunks)
+    are cached in memory per worker.
+    """
+    base_temp = tmp_path_factory.getbasetemp()
+    # xdist workers get their own basetemp inside the run's shared one
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        base_temp = base_temp.parent
+    directory = base_temp / "frontend-assets"
+    directory.mkdir(exist_ok=True)
+    manifest_path = directory / "manifest.json"
+    failed_path = directory / "warm-up.failed"
+
+    try:
+        (directory / "warm-up.lock").touch(exist_ok=False)
+        is_warming_worker = True
+    except FileExistsError:
+        is_warming_worker = False
+
+    if not is_warming_worker:
+        deadline = time.monotonic() + 60
+        while (
+            not manifest_path.exists() and not failed_path.exists() and time.monotonic() < deadline
+        ):
+            time.sleep(0.1)
+        if manifest_path.exists():
+            return json.loads(manifest_path.read_text())
+        # The warming worker failed or did not finish in time; warm this worker's cache itself
+
+    cache = {}
+    context = browser.new_context(viewport=DESKTOP_VIEWPORT)
+    try:
+        page = _new_page(context, cache)
+        page.goto(BASE_URL, wait_until="load")
+        if is_warming_worker:
+            return _write_asset_cache(directory, cache)
+        return cache
+    except Exception:
+        if is_warming_worker:
+            failed_path.touch()
+        raise
+    finally:
+        context.close()
 
 
 @pytest.fixture
-def page(page: Page) -> Page:
+def page(page: Page, frontend_asset_cache: dict) -> Page:
     """
     Override the default Playwright page fixture.
 
-    Sets desktop viewport size (1280x800) for consistent desktop testing.
-    Blocks HMR/websocket requests to prevent page refreshes during tests.
+    Blocks HMR/websocket requests to prevent page refreshes during tests
+    and serves frontend assets from the session cache.
     """
-    page.set_viewport_size({"width": 1280, "height": 800})
-    _block_hmr(page)
+    _serve_cached_assets(page.context, frontend_asset_cache)
+    _block_hmr(page.context)
     return page
 
 
+@pytest.fixture(scope="module")
+def loaded_desktop_viewport() -> dict[str, int]:
+    """
+    Viewport of loaded_desktop_page. Override it in a test module to load the shared
+    page at another desktop size.
+    """
+    return DESKTOP_VIEWPORT
+
+
+@pytest.fixture(scope="module")
+def loaded_desktop_page(
+    browser: Browser, frontend_asset_cache: dict, loaded_desktop_viewport: dict[str, int]
+) -> Generator[Page, None, None]:
+    """
+    Desktop page with the app loaded, shared by all tests in a module that request it.
+
+    Only for tests that read the page without changing it (or undo their changes).
+    The page lives outside pytest-playwright's per-test contexts, so no video is
+    recorded for it. Map tiles and web fonts are not loaded.
+    """
+    context = browser.new_context(viewport=loaded_desktop_viewport)
+    page = _new_page(context, frontend_asset_cache)
+    page.route(EXTERNAL_RESOURCE_PATTERN, lambda route: route.abort())
+    page.goto(BASE_URL, wait_until="commit")
+    expect(page.locator("#filter-form")).to_be_visible(timeout=10000)
+
+    yield page
+
+    context.close()
+
+
+@pytest.fixture(scope="class")
+def geolocation_denied_page(
+    browser: Browser, frontend_asset_cache: dict
+) -> Generator[Page, None, None]:
+    """
+    Desktop page with the app loaded and geolocation denied, shared by a test class.
+
+    GEOLOCATION_DENIED_SCRIPT is registered on the context before the page loads, so
+    the location-dependent buttons start disabled. Tests must leave the page as they
+    found it (e.g. move the mouse away after hovering). Map tiles and web fonts are
+    not loaded, and no video is recorded.
+    """
+    context = browser.new_context(viewport=DESKTOP_VIEWPORT)
+    context.add_init_script(GEOLOCATION_DENIED_SCRIPT)
+    page = _new_page(context, frontend_asset_cache)
+    page.route(EXTERNAL_RESOURCE_PATTERN, lambda route: route.abort())
+    goto_ready(page, BASE_URL)
+
+    yield page
+
+    context.close()
+
+
+@pytest.fixture(scope="session")
+def polish_storage_state(browser: Browser, frontend_asset_cache: dict) -> dict:
+    """
+    Browser storage state with the UI language switched to Polish.
+
+    The language is kept in the server session cookie, so it is selected through
+    the language menu once per session and restored into new contexts from here.
+    """
+    context = browser.new_context(viewport=DESKTOP_VIEWPORT)
+    page = _new_page(context, frontend_asset_cache)
+    page.goto(BASE_URL, wait_until="domcontentloaded")
+    switch_to_language(page, "polski")
+    state = context.storage_state()
+    context.close()
+    return state
+
+
+@pytest.fixture
+def polish_page(new_context, frontend_asset_cache: dict, polish_storage_state: dict) -> Page:
+    """
+    Page whose context starts with the UI language set to Polish.
+
+    Built through pytest-playwright's new_context, so context arguments, markers
+    and video recording apply just like for the default page fixture.
+    """
+    context = new_context(storage_state=polish_storage_state)
+    page = _new_page(context, frontend_asset_cache)
+    return page
+
+
+@pytest.fixture
+def no_external_resources(page: Page) -> None:
+    """
+    Abort map tile and web font requests for tests that only check the app's own UI.
+
+    Use with @pytest.mark.usefixtures("no_external_resources").
+    """
+    page.route(EXTERNAL_RESOURCE_PATTERN, lambda route: route.abort())
+
+
 @pytest.fixture
 def window_open_stub(page: Page) -> Callable[[], list[str]]:
     """
@@ -113,13 +449,36 @@ def window_open_stub(page: Page) -> Callable[[], list[str]]:
     return _stub_window_open(page)
 
 
+@pytest.fixture(scope="session")
+def mobile_contexts(browser: Browser) -> Generator[dict[str, BrowserContext], None, None]:
+    """
+    Browser contexts per mobile device profile, shared by all tests in the session.
+
+    Contexts are created on first use by mobile_page and closed at the end of the session
+    (before the browser, which this fixture depends on).
+    """
+    contexts: dict[str, BrowserContext] = {}
+
+    yield contexts
+
+    for context in contexts.values():
+        context.close()
+
+
 @pytest.fixture
-def mobile_page(browser, request) -> Generator[Page, None, None]:
+def mobile_page(
+    browser, request, mobile_contexts: dict, frontend_asset_cache: dict
+) -> Generator[Page, None, None]:
     """
     Create a page with proper mobile device emulation.
 
-    Creates a new browser context with the correct user agent,
-    ensuring that react-device-detect properly identifies the device as mobile.
+    Opens the page in the session's browser context for the device, which has the
+    correct user agent, ensuring that react-device-detect properly identifies the
+    device as mobile. After each test the page's web storage (local and session
+    storage, IndexedDB), the context's cookies, permissions and geolocation, and any
+    routes added by the test are reset, so state does not leak between tests sharing a
+    device context. Init scripts cannot be removed from a context, so tests must add
+    them to the page (as mobile_window_open_stub does), not to mobile_page.context.
 
     Supports two parametrization styles:
     1. Indirect: @pytest.mark.parametrize("mobile_page", ALL_MOBILE_DEVICES, indirect=True)
@@ -135,20 +494,33 @@ def mobile_page(browser, request) -> Generator[Page, None, None]:
         if not device_name:
             raise ValueError("mobile_page fixture requires 'device_name' parameter")
 
-    device_config = MOBILE_DEVICES[device_name]
+    context = mobile_contexts.get(device_name)
+    if context is None:
+        device_config = MOBILE_DEVICES[device_name]
+        context = browser.new_context(
+            viewport=device_config.viewport,
+            user_agent=device_config.user_agent,
+            has_touch=device_config.has_touch,
+        )
+        _serve_cached_assets(context, frontend_asset_cache)
+        _block_hmr(context)
+        mobile_contexts[device_name] = context
 
-    context = browser.new_context(
-        viewport=device_config["viewport"],
-        user_agent=device_config["user_agent"],
-        has_touch=True,
-    )
     page = context.new_page()
-    _block_hmr(page)
 
     yield page
 
+    if page.url.startswith(BASE_URL):
+        page.evaluate(CLEAR_WEB_STORAGE_SCRIPT)
     page.close()
-    context.close()
+    context.clear_cookies()
+    context.clear_permissions()
+    context.set_geolocation(None)
+    # Drop routes added by the test and re-arm the asset and HMR routes. unroute_all()
+    # keeps the HMR websocket route from _block_hmr(), so that is not registered again
+    context.unroute_all(behavior="ignoreErrors")
+    _serve_cached_assets(context, frontend_asset_cache)
+    context.route(HMR_URL_PATTERN, lambda route: route.abort())
 
 
 @pytest.fixture
@@ -176,43 +548,86 @@ def geolocation(context: BrowserContext) -> Callable[[float, float], None]:
     return set_location
 
 
+def _ns_to_ms(time_ns: float) -> float:
+    """Convert a time in nanoseconds to milliseconds, rounded for reporting."""
+    return round(time_ns / 1_000_000, 2)
+
+
 @pytest.fixture
 def performance_tracker():
     """
     Track performance metrics for stress tests.
 
     Returns an object with methods to add_run(), calculate_stats(), and save() results.
+    Run times are passed to add_run() in nanoseconds; the stats report milliseconds.
     """
 
     class PerformanceTracker:
+        __slots__ = (
+            "runs",
+            "times_ns",
+            "markers",
+            "num_runs",
+            "expected_runs",
+            "_sum_time_ns",
+            "_min_time_ns",
+            "_max_time_ns",
+            "_sum_markers",
+        )
+
         def __init__(self):
-            self.run_times = []
+            # One typed array per field (run number, time in ns, marker count); times
+            # stay integer nanoseconds and are only converted to ms for the stats
+            self.runs = array("i")
+            self.times_ns = array("q")
+            self.markers = array("i")
             self.num_runs = 0
             self.expected_runs = 0
-
-        def add_run(self, run_number: int, time_ms: float, markers: int):
-            self.run_times.append(
-                {"run": run_number, "time": round(time_ms, 2), "markers": markers}
-            )
+            # Running totals, so calculate_stats() does not re-scan the arrays
+            self._sum_time_ns = 0
+            self._min_time_ns = 0
+            self._max_time_ns = 0
+            self._sum_markers = 0
+
+        def add_run(self, run_number: int, time_ns: int, markers: int):
+            self.runs.append(run_number)
+            self.times_ns.append(time_ns)
+            self.markers.append(markers)
+            if self.num_runs:
+                self._min_time_ns = min(self._min_time_ns, time_ns)
+                self._max_time_ns = max(self._max_time_ns, time_ns)
+            else:
+                self._min_time_ns = self._max_time_ns = time_ns
             self.num_runs += 1
+            self._sum_time_ns += time_ns
+            self._sum_markers += markers
+
+        @property
+        def run_times(self) -> list[dict]:
+            """Per-run records in ms, built from the arrays when needed (e.g. for saving)."""
+            return [
+                {"run": run, "time": _ns_to_ms(time_ns), "markers": markers}
+                for run, time_ns, markers in zip(
+                    self.runs, self.times_ns, self.markers, strict=True
+                )
+            ]
 
         def calculate_stats(self, max_allowed_ms: int = 25000):
-            if not self.run_times:
+            if not self.num_runs:
                 return {}
 
-            times = [r["time"] for r in self.run_times]
-            markers = [r["markers"] for r in self.run_times]
+            count = self.num_runs
 
             return {
                 "numRuns": self.num_runs,
                 "expectedRuns": self.expected_runs or self.num_runs,
                 "runTimes": self.run_times,
-                "avgTime": round(sum(times) / len(times), 2),
-                "minTime": round(min(times), 2),
-                "maxTime": round(max(times), 2),
-                "avgMarkers": round(sum(markers) / len(markers), 2) if markers else 0,
+                "avgTime": _ns_to_ms(self._sum_time_ns / count),
+                "minTime": _ns_to_ms(self._min_time_ns),
+                "maxTime": _ns_to_ms(self._max_time_ns),
+                "avgMarkers": round(self._sum_markers / count, 2),
                 "maxAllowed": max_allowed_ms,
-                "passed": max(times) <= max_allowed_ms,
+                "passed": self._max_time_ns <= max_allowed_ms * 1_000_000,
             }
 
         def save(self, filepath: str, max_allowed_ms: int = 25000):
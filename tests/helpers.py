@@ -6,11 +6,22 @@ Provides utility functions for:
 - Marker selection workarounds
 - Popup content verification
 - Problem form testing
+- Language switching
+- Left panel and popup locators
+- Navigation with an app-ready wait
+- Button style checks
 """
 
 from typing import Any
 
-from playwright.sync_api import ElementHandle, Page, expect
+from playwright.sync_api import ElementHandle, Locator, Page, expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+# Selectors of the map popup: a Leaflet popup on desktop, a Material-UI dialog
+# (bottom sheet) on mobile
+POPUP_SELECTOR = ".leaflet-popup-content"
+POPUP_CLOSE_BUTTON_SELECTOR = ".leaflet-popup-close-button"
+MOBILE_POPUP_SELECTOR = ".MuiDialogContent-root"
 
 # Test data for Zwierzyniecka location
 # Note: Category names are translated (e.g., "type_of_place" -> "type of place")
@@ -48,13 +59,16 @@ def get_rightmost_marker(page: Page) -> ElementHandle | None:
             let rightmostMarker = null;
             let maxX = -Infinity;
 
-            markers.forEach(marker => {
-                const rect = marker.getBoundingClientRect();
-                if (rect.x > maxX) {
-                    maxX = rect.x;
-                    rightmostMarker = marker;
+            for (let i = 0, n = markers.length; i < n; i++) {
+                // Leaflet keeps each marker's position in _leaflet_pos; only read
+                // the layout when it is missing
+                const pos = markers[i]._leaflet_pos;
+                const x = pos ? pos.x : markers[i].getBoundingClientRect().x;
+                if (x > maxX) {
+                    maxX = x;
+                    rightmostMarker = markers[i];
                 }
-            });
+            }
 
             return rightmostMarker;
         }
@@ -64,7 +78,138 @@ def get_rightmost_marker(page: Page) -> ElementHandle | None:
     return handle.as_element()
 
 
-def verify_popup_content(page: Page, expected_content: dict[str, Any]) -> None:
+def wait_for_all_visible(page: Page, selectors: list[str], timeout: float = 5000) -> None:
+    """
+    Wait until an element matching each selector is visible.
+
+    All selectors are checked together in one in-page wait, instead of one
+    to_be_visible() polling loop per element. On timeout the assertion lists the
+    selectors that were still not visible.
+
+    Args:
+        page: Playwright page object
+        selectors: CSS selectors that must all match a visible element
+        timeout: Maximum time to wait in milliseconds
+    """
+    find_hidden = """selectors => selectors.filter(sel => {
+        const el = document.querySelector(sel);
+        return !el || !el.checkVisibility();
+    })"""
+    try:
+        page.wait_for_function(
+            f"selectors => ({find_hidden})(selectors).length === 0",
+            arg=selectors,
+            timeout=timeout,
+        )
+    except PlaywrightTimeoutError:
+        hidden = page.evaluate(find_hidden, selectors)
+        raise AssertionError(f"Elements not visible: {hidden}") from None
+
+
+def wait_for_marker_count(page: Page, count: int, timeout: float = 5000) -> None:
+    """
+    Wait until exactly ``count`` markers are on the map.
+
+    The count is checked inside the page on every animation frame, instead of being
+    polled from the test, and the wait returns as soon as it matches.
+
+    Args:
+        page: Playwright page object
+        count: Expected number of .leaflet-marker-icon elements
+        timeout: Maximum time to wait in milliseconds
+    """
+    try:
+        page.wait_for_function(
+            "count => document.querySelectorAll('.leaflet-marker-icon').length === count",
+            arg=count,
+            timeout=timeout,
+        )
+    except PlaywrightTimeoutError:
+        actual = page.evaluate("() => document.querySelectorAll('.leaflet-marker-icon').length")
+        raise AssertionError(f"Expected {count} markers on the map, got: {actual}") from None
+
+
+def expand_cluster_and_click_rightmost_marker(
+    page: Page, marker_count: int = 2, timeout: float = 5000, load_timeout: float = 30000
+) -> None:
+    """
+    Expand the first marker cluster and click the rightmost of the revealed markers.
+
+    Runs as a single evaluate() call: a MutationObserver waits for the first marker,
+    clicks it, waits (watching only the Leaflet map pane) until ``marker_count``
+    markers are on the map and then clicks the rightmost one (the same workaround as
+    get_rightmost_marker()). Markers are clicked with element.click() so overlays
+    cannot intercept the click on CI.
+
+    Sorting ``locator.all()`` by ``bounding_box()`` in Python reads more simply, but
+    costs one round trip per marker plus one per click; even with two markers the
+    single evaluate() is cheaper, and the gap grows with the marker count.
+
+    Callers usually navigate with wait_until="commit", so the wait for the first
+    marker also covers the page load, the places API request and the first render;
+    it gets its own ``load_timeout`` (Playwright's default action timeout).
+
+    Args:
+        page: Playwright page object
+        marker_count: Number of markers expected once the cluster is expanded
+        timeout: Maximum time to wait for the cluster to expand, in milliseconds
+        load_timeout: Maximum time to wait for the first marker, in milliseconds
+    """
+    page.evaluate(
+        """async ([markerCount, timeout, loadTimeout]) => {
+            // Live collection: always reflects the markers currently on the map
+            const markers = document.getElementsByClassName('leaflet-marker-icon');
+            const waitFor = (condition, what, root, ms) => new Promise((resolve, reject) => {
+                if (condition()) {
+                    resolve();
+                    return;
+                }
+                const observer = new MutationObserver(() => {
+                    if (condition()) {
+                        observer.disconnect();
+                        clearTimeout(timer);
+                        resolve();
+                    }
+                });
+                const timer = setTimeout(() => {
+                    observer.disconnect();
+                    reject(new Error(`Timed out after ${ms}ms waiting for ${what}`));
+                }, ms);
+                observer.observe(root, {childList: true, subtree: true});
+            });
+
+            // The page may still be loading (even without a <body> right after a
+            // navigation commits), so watch the whole document for the first marker
+            const root = document.documentElement;
+            await waitFor(() => markers.length > 0, 'the first marker', root, loadTimeout);
+            markers[0].click();
+
+            // Markers are only added and removed inside the map pane
+            const mapPane = document.querySelector('.leaflet-map-pane');
+            const expanded = () => markers.length === markerCount;
+            await waitFor(expanded, `${markerCount} markers`, mapPane, timeout);
+
+            // Leaflet positions markers with CSS transforms, so offsetLeft is useless;
+            // use the position Leaflet keeps in _leaflet_pos, or the layout if missing
+            let rightmost = null;
+            let maxX = -Infinity;
+            for (let i = 0, n = markers.length; i < n; i++) {
+                const pos = markers[i]._leaflet_pos;
+                const x = pos ? pos.x : markers[i].getBoundingClientRect().x;
+                if (x > maxX) {
+                    maxX = x;
+                    rightmost = markers[i];
+                }
+            }
+            rightmost.click();
+        }""",
+        [marker_count, timeout, load_timeout],
+    )
+
+
+def verify_popup_content(
+    page: Page, expected_content: dict[str, Any], timeout: float = 5000
+) -> None:
     """
     Verifies popup content including title, subtitle, categories, and CTA button.
 
@@ -80,6 +225,7 @@ def verify_popup_content(page: Page, expected_content: dict[str, Any]) -> None:
             - subtitle: Expected subtitle text
             - categories: List of [category, value] tuples
             - CTA (optional): Dict with displayValue and value (URL)
+        timeout: Maximum time to wait for the content in milliseconds
 
     Example:
         verify_popup_content(page, {
@@ -89,29 +235,59 @@ def verify_popup_content(page: Page, expected_content: dict[str, Any]) -> None:
             "CTA": {"displayValue": "View on Map", "value": "https://..."}
         })
     """
-    # Scope to popup container
-    popup = page.locator(".leaflet-popup-content, .MuiDialogContent-root")
-
-    # Verify title (h3 element in new frontend)
-    title = popup.locator("h3")
-    expect(title).to_have_text(expected_content["title"])
-
-    # Verify subtitle (p element after title in new frontend)
-    subtitle = popup.locator("p").first
-    expect(subtitle).to_have_text(expected_content["subtitle"])
-
-    # Verify categories
-    # Note: We only check that category labels are visible
-    # The values may appear in multiple places (subtitle + category value)
-    # so we check for their presence at least once
-    for category, value in expected_content["categories"]:
-        expect(popup.get_by_text(category).first).to_be_visible()
-        # Check that the value appears at least once in the popup
-        expect(popup.get_by_text(value).first).to_be_visible()
-
-    # Verify and click CTA button if provided
+    # Title (h3), subtitle (first p) and every category label and value are checked
+    # together in one in-page wait, instead of one expect() polling loop per text
+    find_missing = """([selector, expected]) => {
+        const popup = document.querySelector(selector);
+        if (!popup) {
+            return ['popup'];
+        }
+        const normalize = text => (text || '').replace(/\\s+/g, ' ').trim();
+        const missing = [];
+        if (normalize(popup.querySelector('h3')?.textContent) !== expected.title) {
+            missing.push(`title "${expected.title}"`);
+        }
+        if (normalize(popup.querySelector('p')?.textContent) !== expected.subtitle) {
+            missing.push(`subtitle "${expected.subtitle}"`);
+        }
+        // Like get_by_text(): the deepest elements whose text contains the string,
+        // ignoring case, must include a visible one; an ancestor such as the popup
+        // itself does not count. Values may appear more than once (subtitle + value)
+        const elements = Array.from(popup.querySelectorAll('*'));
+        for (const text of expected.texts) {
+            const needle = text.toLowerCase();
+            const matches = el => normalize(el.textContent).toLowerCase().includes(needle);
+            const found = elements.some(
+                el => matches(el)
+                    && !Array.from(el.children).some(matches)
+                    && el.checkVisibility()
+            );
+            if (!found) {
+                missing.push(`"${text}"`);
+            }
+        }
+        return missing;
+    }"""
+    arg = [
+        f"{POPUP_SELECTOR}, {MOBILE_POPUP_SELECTOR}",
+        {
+            "title": expected_content["title"],
+            "subtitle": expected_content["subtitle"],
+            "texts": [text for pair in expected_content["categories"] for text in pair],
+        },
+    ]
+    try:
+        page.wait_for_function(
+            f"arg => ({find_missing})(arg).length === 0", arg=arg, timeout=timeout
+        )
+    except PlaywrightTimeoutError:
+        missing = page.evaluate(find_missing, arg)
+        raise AssertionError(f"Popup content not found: {missing}") from None
+
+    # Verify and click CTA button if provided (a real click, so it stays a locator action)
     if "CTA" in expected_content:
         cta = expected_content["CTA"]
+        popup = page.locator(f"{POPUP_SELECTOR}, {MOBILE_POPUP_SELECTOR}")
         cta_button = popup.locator("button", has_text=cta["displayValue"])
         expect(cta_button).to_be_visible()
         cta_button.click()
@@ -135,7 +311,7 @@ def verify_problem_form(page: Page) -> None:
 
     # Wait for form to appear inside the popup
     # Scope to popup to avoid matching the filter form
-    popup = page.locator(".leaflet-popup-content, .MuiDialogContent-root")
+    popup = page.locator(f"{POPUP_SELECTOR}, {MOBILE_POPUP_SELECTOR}")
     form = popup.locator("form")
     expect(form).to_be_visible()
 
@@ -190,3 +366,147 @@ def verify_problem_form(page: Page) -> None:
     success_message = popup.get_by_text("Location reported")
     expect(success_message).to_be_visible()
     expect(form).not_to_be_visible()
+
+
+def get_language_button(page: Page) -> Locator:
+    """
+    Get language switch button using flexible selectors.
+
+    The button's accessible name changes with language:
+    - English: "Language switch icon, used to change the language..."
+    - Polish: "Ikona zmiany języka, używana do zmiany języka strony"
+
+    Uses ID selector which works across all languages.
+    """
+    return page.locator("#languages-menu")
+
+
+def get_language_link(page: Page, lang_name: str) -> Locator:
+    """
+    Get the language menu entry for the given language name (e.g. "polski").
+
+    The entries carry no id or hreflang attribute, so they are located by
+    their accessible name.
+    """
+    return page.get_by_role("link", name=lang_name)
+
+
+def switch_to_language(page: Page, lang_name: str) -> None:
+    """
+    Switch to a specific language by clicking the language menu.
+
+    Args:
+        page: Playwright page object
+        lang_name: Language name as shown in the menu (e.g. "polski", "English")
+    """
+    get_language_button(page).click()
+    get_language_link(page, lang_name).click()
+    page.wait_for_load_state("domcontentloaded")
+
+
+def get_left_panel(page: Page) -> Locator:
+    """Get the left (filter) panel."""
+    return page.locator("#left-panel")
+
+
+def get_left_panel_toggle(page: Page) -> Locator:
+    """Get the button that opens the left panel on mobile and tablet layouts."""
+    return page.locator('button[aria-label="Toggle left panel"]')
+
+
+def get_left_panel_close_button(page: Page) -> Locator:
+    """Get the close button shown inside the open left panel on mobile and tablet layouts."""
+    return page.locator('button[aria-label="Close left panel"]')
+
+
+def get_popup(page: Page) -> Locator:
+    """Get the content of the open marker popup on desktop."""
+    return page.locator(POPUP_SELECTOR)
+
+
+def get_popup_close_button(page: Page) -> Locator:
+    """Get the close button of the open marker popup on desktop."""
+    return page.locator(POPUP_CLOSE_BUTTON_SELECTOR)
+
+
+def get_mobile_popup(page: Page) -> Locator:
+    """Get the content of the marker popup dialog (bottom sheet) on mobile."""
+    return page.locator(MOBILE_POPUP_SELECTOR)
+
+
+def goto_ready(page: Page, url: str) -> None:
+    """
+    Navigate to the map page and wait until the app has mounted.
+
+    Returns as soon as the response is committed and then waits, in the page, for the
+    Leaflet map container and the location button to be rendered, instead of waiting
+    for DOMContentLoaded and polling locators afterwards.
+
+    Args:
+        page: Playwright page object
+        url: Map page URL (usually BASE_URL)
+    """
+    page.goto(url, wait_until="commit")
+    page.wait_for_function(
+        """() => !!(
+            document.querySelector('.leaflet-container')
+            && document.querySelector('[aria-label*="Location target"]')
+        )"""
+    )
+
+
+def get_button_styles(page: Page, selectors: list[str]) -> list[dict[str, str] | None]:
+    """
+    Read the computed opacity and filter of several buttons in one evaluate() call.
+
+    Returns one {"opacity": ..., "filter": ...} dict per selector, or None for a
+    selector that matches nothing.
+    """
+    return page.evaluate(
+        """selectors => selectors.map(sel => {
+            const el = document.querySelector(sel);
+            if (!el) return null;
+            const style = getComputedStyle(el);
+            return {opacity: style.opacity, filter: style.filter};
+        })""",
+        selectors,
+    )
+
+
+def expect_button_styles(
+    page: Page, selectors: list[str], expected: dict[str, str], timeout: float = 5000
+) -> None:
+    """
+    Wait until every button has the expected opacity and filter, then assert it.
+
+    The wait runs in the page and resolves as soon as all buttons match (e.g. once the
+    enabled/disabled transition has finished); on timeout the assertion reports the
+    styles actually found.
+
+    Args:
+        page: Playwright page object
+        selectors: CSS selectors of the buttons to check
+        expected: Expected {"opacity": ..., "filter": ...} computed values
+        timeout: Maximum time to wait in milliseconds
+    """
+    try:
+        page.wait_for_function(
+            """([selectors, expected]) => selectors.every(sel => {
+                const el = document.querySelector(sel);
+                if (!el) return false;
+                const style = getComputedStyle(el);
+                return style.opacity === expected.opacity && style.filter === expected.filter;
+            })""",
+            arg=[selectors, expected],
+            timeout=timeout,
+        )
+    except PlaywrightTimeoutError:
+        pass  # the assertion below reports the mismatch
+
+    styles = get_button_styles(page, selectors)
+    mismatched = {
+        selector: style
+        for selector, style in zip(selectors, styles, strict=True)
+        if style != expected
+    }
+    assert not mismatched, f"Expected button style {expected}, got: {mismatched}"
@@ -10,6 +10,48 @@ import time
 from playwright.sync_api import Page, expect
 
 from tests.conftest import BASE_URL, MARKER_LOAD_TIMEOUT
+from tests.helpers import get_popup
+
+MARKER_SELECTOR = ".leaflet-marker-icon, .leaflet-marker-cluster"
+
+# How long the marker count must stay unchanged to count as stable
+# (the same as three consecutive equal readings 500ms apart)
+MARKER_STABLE_FOR_MS = 1500
+
+MARKER_STABLE_TIMEOUT_MS = 60000
+
+# Resolves to true once there are at least minMarkers markers and their count has not
+# changed for stableForMs, or to false after timeout. A MutationObserver recounts the
+# markers only when the DOM changes and restarts the stability timer when the count does.
+MARKERS_STABLE_JS = """([selector, minMarkers, stableForMs, timeout]) => new Promise(resolve => {
+    const countMarkers = () => document.querySelectorAll(selector).length;
+    let count = countMarkers();
+    let stableTimer = null;
+    const finish = stable => {
+        observer.disconnect();
+        clearTimeout(stableTimer);
+        clearTimeout(timeoutTimer);
+        resolve(stable);
+    };
+    const restartStableTimer = () => {
+        clearTimeout(stableTimer);
+        if (count >= minMarkers) {
+            stableTimer = setTimeout(() => finish(true), stableForMs);
+        }
+    };
+    const observer = new MutationObserver(() => {
+        const current = countMarkers();
+        if (current !== count) {
+            count = current;
+            restartStableTimer();
+        }
+    });
+    const timeoutTimer = setTimeout(() => finish(false), timeout);
+    // The page may still be loading right after the navigation commits,
+    // so watch the whole document
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    restartStableTimer();
+})"""
 
 
 class TestStress:
@@ -32,68 +74,51 @@ class TestStress:
 
         performance_tracker.expected_runs = num_runs
 
+        # Locators are lazy, so they are created once and re-evaluated on every run
+        markers = page.locator(MARKER_SELECTOR)
+        clusters = page.locator(".marker-cluster")
+        individual_markers = page.locator(".leaflet-marker-icon:not(.marker-cluster)")
+        popup = get_popup(page)
+
         for run_number in range(1, num_runs + 1):
             print(f"\nRun {run_number} of {num_runs}")
 
-            # Start timing
-            start_time = time.time()
-
-            # Navigate to the page
-            page.goto(BASE_URL, wait_until="domcontentloaded")
-
-            # Wait for first marker/cluster to appear (indicates map is loaded)
-            # Use longer timeout for stress test since 100k markers take longer to load
-            first_marker = page.locator(".leaflet-marker-icon, .leaflet-marker-cluster").first
-            expect(first_marker).to_be_visible(timeout=max_allowed_time_ms)
-
-            # Wait for markers to stabilize (stop increasing in count)
-            # This ensures all initial markers are rendered
-            previous_count = 0
-            stable_count = 0  # Count consecutive stable readings
-            max_attempts = 120  # 60 seconds at 500ms intervals
-            attempt = 0
-
-            while attempt < max_attempts:
-                # Get current marker count
-                current_count = page.locator(
-                    ".leaflet-marker-icon, .leaflet-marker-cluster"
-                ).count()
-
-                # Check if count has stabilized
-                if current_count == previous_count and current_count >= min_expected_markers:
-                    stable_count += 1
-                    # Require 3 consecutive stable readings
-                    if stable_count >= 3:
-                        break
-                else:
-                    stable_count = 0
-                    if current_count != previous_count:
-                        print(f"Marker count changed: {previous_count} -> {current_count}")
-
-                previous_count = current_count
-                time.sleep(0.5)
-                attempt += 1
-
-            if attempt >= max_attempts:
+            # Start timing (monotonic, so clock adjustments cannot skew a run)
+            start_ns = time.perf_counter_ns()
+
+            # Navigate to the page; goto returns as soon as the navigation commits and
+            # the marker wait below covers the rest of the page load
+            page.goto(BASE_URL, wait_until="commit")
+
+            # Wait for markers to stabilize (stop increasing in count), watched inside
+            # the page. This ensures all initial markers are rendered
+            is_stable = page.evaluate(
+                MARKERS_STABLE_JS,
+                [
+                    MARKER_SELECTOR,
+                    min_expected_markers,
+                    MARKER_STABLE_FOR_MS,
+                    MARKER_STABLE_TIMEOUT_MS,
+                ],
+            )
+            if not is_stable:
                 raise TimeoutError(
                     f"Markers did not stabilize at minimum {min_expected_markers} within timeout"
                 )
 
             # Get final marker count
-            markers = page.locator(".leaflet-marker-icon, .leaflet-marker-cluster")
             marker_count = markers.count()
 
             # Calculate elapsed time
-            end_time = time.time()
-            elapsed_ms = (end_time - start_time) * 1000
+            elapsed_ns = time.perf_counter_ns() - start_ns
 
             print(
-                f"Run {run_number} took {elapsed_ms:.0f}ms "
+                f"Run {run_number} took {elapsed_ns / 1_000_000:.0f}ms "
                 f"and loaded {marker_count} markers/clusters"
             )
 
             # Record performance data
-            performance_tracker.add_run(run_number, elapsed_ms, marker_count)
+            performance_tracker.add_run(run_number, elapsed_ns, marker_count)
 
             # Verify minimum number of markers are loaded
             assert (
@@ -101,9 +126,6 @@ class TestStress:
             ), f"Expected at least {min_expected_markers} markers but got {marker_count}"
 
             # Click clusters until individual markers appear, then click a marker
-            clusters = page.locator(".marker-cluster")
-            individual_markers = page.locator(".leaflet-marker-icon:not(.marker-cluster)")
-            popup = page.locator(".leaflet-popup-content")
             max_clicks = 20
             for i in range(max_clicks):
                 if individual_markers.count() > 0: